@@ -0,0 +1,194 @@
+import argparse
+import gc
+import json
+import platform
+import random
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Tuple
+
+from entities.medical.MedicalAppointment import MedicalAppointment
+from entities.medical.MedicalManagementSystem import QUEUE_ENGINES, MedicalManagementSystem
+from entities.patients.Age import MAX_AGE, MIN_AGE, Age
+from entities.patients.Patient import Patient
+from entities.patients.Priority import PRIORITIES_LIST, Priority
+from services.MedicalManagementSystemService import MedicalManagementSystemService
+
+DEFAULT_SIZES = [10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6]
+DEFAULT_SEED = 42
+OPERATIONS = ['make_an_appointment', 'add_appointment', 'duplicate_check', 'order_appointments', 'str']
+
+class SchedulingBenchmark:
+    """Reproducible scaling benchmark of the scheduling hot paths.
+
+    For every queue engine and queue size it times each operation and then
+    measures its peak traced memory in a second run, so tracing never skews
+    the timings. The same seed always produces the same rows.
+
+    Attributes:
+        _sizes (List[int]): The queue sizes to be measured.
+        _engines (List[str]): The queue engines to be measured.
+        _seed (int): The seed of the generated rows.
+        _memory (bool): Whether peak memory is measured.
+    """
+    def __init__(self, sizes: List[int] = None, engines: List[str] = None, seed: int = DEFAULT_SEED, memory: bool = True):
+        """Initializes a SchedulingBenchmark instance.
+
+        Args:
+            sizes (List[int]): The queue sizes to be measured, DEFAULT_SIZES by default.
+            engines (List[str]): The queue engines to be measured, every engine by default.
+            seed (int): The seed of the generated rows.
+            memory (bool): Whether peak memory is measured.
+        """
+        self._sizes: List[int] = sizes or DEFAULT_SIZES
+        self._engines: List[str] = engines or list(QUEUE_ENGINES)
+        self._seed: int = seed
+        self._memory: bool = memory
+
+    def _rows(self, size: int) -> List[Tuple[str, int, str]]:
+        """Generates the (name, age, priority) rows of one size.
+
+        Args:
+            size (int): The number of rows.
+
+        Returns:
+            List[Tuple[str, int, str]]: The rows.
+        """
+        generator = random.Random(self._seed)
+        return [(f"Paciente {index}", generator.randint(MIN_AGE, MAX_AGE), generator.choice(PRIORITIES_LIST)) for index in range(size)]
+
+    def _cases(self, engine: str, rows: List[Tuple[str, int, str]]) -> Dict[str, Tuple[Callable[[], object], Callable[[object], None]]]:
+        """Builds the setup and measured body of every operation.
+
+        Args:
+            engine (str): The queue engine.
+            rows (List[Tuple[str, int, str]]): The rows to be scheduled.
+
+        Returns:
+            Dict[str, Tuple[Callable[[], object], Callable[[object], None]]]: The (setup, body) pair of each operation.
+        """
+        def appointments() -> List[MedicalAppointment]:
+            return [MedicalAppointment(Patient(name, Age.of(age)), Priority.of(priority)) for name, age, priority in rows]
+
+        def filled() -> MedicalManagementSystem:
+            medical_management_system = MedicalManagementSystem('Benchmark', engine)
+            medical_management_system.add_appointments(appointments())
+            return medical_management_system
+
+        def make_an_appointment(service: MedicalManagementSystemService):
+            for row in rows:
+                service.make_an_appointment(*row)
+
+        def add_appointment(state: Tuple[MedicalManagementSystem, List[MedicalAppointment]]):
+            medical_management_system, medical_appointments = state
+            for medical_appointment in medical_appointments:
+                medical_management_system.add_appointment(medical_appointment)
+
+        def order_appointments(medical_management_system: MedicalManagementSystem):
+            medical_management_system.order_appointments()
+            medical_management_system.appointments
+
+        return {
+            'make_an_appointment': (lambda: MedicalManagementSystemService(MedicalManagementSystem('Benchmark', engine)), make_an_appointment),
+            'add_appointment': (lambda: (MedicalManagementSystem('Benchmark', engine), appointments()), add_appointment),
+            'duplicate_check': (lambda: (filled(), appointments()), add_appointment),
+            'order_appointments': (filled, order_appointments),
+            'str': (filled, str),
+        }
+
+    def _measure(self, setup: Callable[[], object], body: Callable[[object], None]) -> Tuple[float, int]:
+        """Times one operation and, optionally, measures its peak memory in a second run.
+
+        Args:
+            setup (Callable[[], object]): Builds the untimed state of the operation.
+            body (Callable[[object], None]): The measured operation.
+
+        Returns:
+            Tuple[float, int]: The elapsed seconds and the peak traced bytes, None when memory is not measured.
+        """
+        state = setup()
+        gc.collect()
+        start = time.perf_counter()
+        body(state)
+        elapsed = time.perf_counter() - start
+        peak = None
+        if self._memory:
+            state = setup()
+            gc.collect()
+            tracemalloc.start()
+            body(state)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+        return elapsed, peak
+
+    def run(self, progress: Callable[[str], None] = None) -> dict:
+        """Runs every operation for every engine and size.
+
+        Args:
+            progress (Callable[[str], None]): Receives one line per measurement, e.g. print.
+
+        Returns:
+            dict: The JSON-serializable report with one scaling curve per engine and operation.
+        """
+        results = {engine: {operation: [] for operation in OPERATIONS} for engine in self._engines}
+        for size in self._sizes:
+            rows = self._rows(size)
+            for engine in self._engines:
+                for operation, (setup, body) in self._cases(engine, rows).items():
+                    elapsed, peak = self._measure(setup, body)
+                    point = {
+                        'size': size,
+                        'seconds': elapsed,
+                        'seconds_per_op': elapsed / size,
+                        'peak_bytes': peak,
+                        'peak_bytes_per_op': None if peak is None else peak / size,
+                    }
+                    results[engine][operation].append(point)
+                    if progress is not None:
+                        progress(f"{engine:>7} {operation:<20} n={size:<8} {elapsed * 1e6 / size:10.3f} µs/op" + ("" if peak is None else f" {peak / size:10.1f} B/op"))
+        return {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'seed': self._seed,
+            'sizes': self._sizes,
+            'results': results,
+        }
+
+def compare(report: dict, baseline: dict) -> List[str]:
+    """Compares the time per operation of a report against a baseline report.
+
+    Args:
+        report (dict): The new report.
+        baseline (dict): The baseline report.
+
+    Returns:
+        List[str]: One line per engine, operation and size present in both reports, with the speedup.
+    """
+    lines = []
+    for engine, operations in report['results'].items():
+        for operation, points in operations.items():
+            baseline_points = {point['size']: point for point in baseline.get('results', {}).get(engine, {}).get(operation, [])}
+            for point in points:
+                baseline_point = baseline_points.get(point['size'])
+                if baseline_point is None or not point['seconds']:
+                    continue
+                lines.append(f"{engine:>7} {operation:<20} n={point['size']:<8} {baseline_point['seconds'] / point['seconds']:8.2f}x")
+    return lines
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Benchmark de escalabilidade do agendamento")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES)
+    parser.add_argument('--engines', nargs='+', choices=list(QUEUE_ENGINES), default=list(QUEUE_ENGINES))
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED)
+    parser.add_argument('--no-memory', action='store_true', help="não mede o pico de memória")
+    parser.add_argument('--output', default='benchmark.json', help="arquivo JSON do resultado")
+    parser.add_argument('--baseline', help="arquivo JSON de uma execução anterior para comparação")
+    arguments = parser.parse_args()
+
+    report = SchedulingBenchmark(arguments.sizes, arguments.engines, arguments.seed, not arguments.no_memory).run(print)
+    with open(arguments.output, 'w', encoding='utf-8') as file:
+        json.dump(report, file, indent=2)
+    if arguments.baseline:
+        with open(arguments.baseline, encoding='utf-8') as file:
+            for line in compare(report, json.load(file)):
+                print(line)
@@ -0,0 +1,111 @@
+import time
+from bisect import bisect_right
+from collections import deque
+from typing import Callable, Deque, Iterator, List, Optional, Tuple
+
+from entities.patients.Age import AGE_SPAN
+from entities.patients.Priority import WEIGHT_PRIORITIES_LIST
+
+class AgingPolicy:
+    """Anti-starvation policy that promotes waiting appointments one step per interval.
+
+    A step raises the effective priority one tier, keeping the patient's age.
+    From the highest tier, the last step moves the appointment to the top key
+    of the queue (highest tier, MAX_AGE), which is served before every other
+    key and in promotion order, so the wait is bounded even when older
+    patients of the highest tier keep arriving.
+
+    Every queued appointment is due for its next promotion one interval after
+    it was queued or last promoted. Since that delay is the same for all of
+    them, due times are appended in increasing order and a single FIFO holds
+    the pending promotions: checking them is O(1) and each promotion is one
+    O(log n) requeue, so nothing is re-sorted as time passes. A policy keeps
+    the state of one medical management system and must not be shared.
+
+    Attributes:
+        _interval (float): The waiting time, in clock units, between two promotions.
+        _max_promotions (int): The maximum number of promotions per appointment, None for up to the top key.
+        _clock (Callable[[], float]): The time source.
+        _weights (List[int]): The priority weights, lowest first, one tier each.
+        _pending (Deque[Tuple[float, int, int]]): The (due time, handle, promotions so far) of each pending promotion.
+    """
+    def __init__(self, interval: float, max_promotions: int = None, clock: Callable[[], float] = time.monotonic):
+        """Initializes an AgingPolicy instance.
+
+        Args:
+            interval (float): The waiting time, in clock units, between two promotions.
+            max_promotions (int): The maximum number of promotions per appointment, None for up to the top key.
+            clock (Callable[[], float]): The time source, time.monotonic by default.
+
+        Raises:
+            ValueError: If the interval is not positive.
+        """
+        if interval <= 0:
+            raise ValueError("O intervalo de promoção deve ser positivo")
+        self._interval: float = interval
+        self._max_promotions: int = max_promotions
+        self._clock: Callable[[], float] = clock
+        self._weights: List[int] = sorted(set(WEIGHT_PRIORITIES_LIST.values()))
+        self._pending: Deque[Tuple[float, int, int]] = deque()
+
+    @property
+    def interval(self) -> float:
+        """Gets the waiting time between two promotions.
+
+        Returns:
+            float: The interval, in clock units.
+        """
+        return self._interval
+
+    def track(self, handle: int, promotions: int = 0):
+        """Schedules the next promotion of a queued appointment one interval from now.
+
+        Args:
+            handle (int): The handle of the appointment.
+            promotions (int): The number of promotions it already received.
+        """
+        if self._max_promotions is None or promotions < self._max_promotions:
+            self._pending.append((self._clock() + self._interval, handle, promotions))
+
+    def due(self) -> Iterator[Tuple[int, int]]:
+        """Takes the promotions whose time has come, oldest first.
+
+        Promotions tracked while iterating are due one interval later, so the
+        iteration always ends.
+
+        Returns:
+            Iterator[Tuple[int, int]]: The (handle, promotions so far) of each due promotion.
+        """
+        pending = self._pending
+        now = self._clock()
+        while pending and pending[0][0] <= now:
+            _, handle, promotions = pending.popleft()
+            yield handle, promotions
+
+    def promoted_key(self, sort_key: int) -> Optional[int]:
+        """Gets the effective sort key one promotion above a key.
+
+        Args:
+            sort_key (int): The current effective sort key.
+
+        Returns:
+            Optional[int]: The same age in the next tier, the top key from the highest tier, or None if it already is the top key.
+        """
+        weight, age = divmod(sort_key, AGE_SPAN)
+        tier = bisect_right(self._weights, weight)
+        if tier < len(self._weights):
+            return self._weights[tier] * AGE_SPAN + age
+        top_key = self._weights[-1] * AGE_SPAN + AGE_SPAN - 1
+        return top_key if sort_key < top_key else None
+
+    def clear(self):
+        """Drops every pending promotion."""
+        self._pending.clear()
+
+    def __len__(self) -> int:
+        """Returns the number of pending promotions, including those of appointments no longer queued.
+
+        Returns:
+            int: The number of pending promotions.
+        """
+        return len(self._pending)
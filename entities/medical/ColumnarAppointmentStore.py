@@ -0,0 +1,158 @@
+from typing import Iterator, List
+
+try:
+    import numpy
+except ImportError:  # numpy is optional, only this store needs it
+    numpy = None
+
+from entities.medical.MedicalAppointment import MedicalAppointment
+from entities.patients.Age import AGE_SPAN, MIN_AGE, Age
+from entities.patients.Patient import Patient
+from entities.patients.Priority import Priority, WEIGHT_PRIORITIES_LIST
+
+class ColumnarAppointmentStore:
+    """Struct-of-arrays snapshot of medical appointments, backed by NumPy.
+
+    Each appointment is one row of parallel arrays, and patient names live in a
+    single UTF-8 buffer addressed by offsets. The attendance order is computed
+    with one vectorized lexsort instead of a Python key function, on a sort key
+    column kept apart from the weights and ages so that aged appointments keep
+    their place without losing their own priority and age.
+
+    Attributes:
+        _weights (numpy.ndarray): The int8 priority weight of each row.
+        _ages (numpy.ndarray): The uint8 patient age of each row.
+        _sequences (numpy.ndarray): The int64 arrival sequence of each row.
+        _sort_keys (numpy.ndarray): The int64 effective sort key of each row.
+        _name_offsets (numpy.ndarray): The int64 offsets of each name in the buffer, with one extra closing offset.
+        _names (bytes): The UTF-8 buffer holding every patient name.
+    """
+    def __init__(self, weights, ages, sequences, name_offsets, names: bytes, sort_keys=None):
+        """Initializes a ColumnarAppointmentStore instance from its columns.
+
+        Args:
+            weights (numpy.ndarray): The priority weight of each row.
+            ages (numpy.ndarray): The patient age of each row.
+            sequences (numpy.ndarray): The arrival sequence of each row.
+            name_offsets (numpy.ndarray): The offsets of each name in the buffer, with one extra closing offset.
+            names (bytes): The UTF-8 buffer holding every patient name.
+            sort_keys (numpy.ndarray): The effective sort key of each row, None to pack it from the weight and age.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        if numpy is None:
+            raise ImportError("O armazenamento colunar requer o pacote numpy")
+        self._weights = numpy.asarray(weights, dtype=numpy.int8)
+        self._ages = numpy.asarray(ages, dtype=numpy.uint8)
+        self._sequences = numpy.asarray(sequences, dtype=numpy.int64)
+        self._name_offsets = numpy.asarray(name_offsets, dtype=numpy.int64)
+        self._names: bytes = names
+        if sort_keys is None:
+            sort_keys = self._weights.astype(numpy.int64) * AGE_SPAN + self._ages - MIN_AGE
+        self._sort_keys = numpy.asarray(sort_keys, dtype=numpy.int64)
+
+    @classmethod
+    def from_appointments(cls, appointments: List[MedicalAppointment]) -> 'ColumnarAppointmentStore':
+        """Builds a store from medical appointments, numbering them in the given order.
+
+        Args:
+            appointments (List[MedicalAppointment]): The appointments in arrival order.
+
+        Returns:
+            ColumnarAppointmentStore: The columnar store.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        if numpy is None:
+            raise ImportError("O armazenamento colunar requer o pacote numpy")
+        size = len(appointments)
+        weights = numpy.fromiter((appointment.priority.weight for appointment in appointments), dtype=numpy.int8, count=size)
+        ages = numpy.fromiter((appointment.patient.age.age for appointment in appointments), dtype=numpy.uint8, count=size)
+        encoded_names = [appointment.patient.name.encode('utf-8') for appointment in appointments]
+        name_offsets = numpy.zeros(size + 1, dtype=numpy.int64)
+        numpy.cumsum(numpy.fromiter(map(len, encoded_names), dtype=numpy.int64, count=size), out=name_offsets[1:])
+        return cls(weights, ages, numpy.arange(size, dtype=numpy.int64), name_offsets, b''.join(encoded_names))
+
+    @classmethod
+    def from_entries(cls, entries: List[list]) -> 'ColumnarAppointmentStore':
+        """Builds a store from queue entries in any order, leaving the ordering to order().
+
+        Weights and ages come from each appointment, while the effective sort
+        key and the sequence of the entry give its place, so no Python sort is
+        needed and aged appointments are restored with their own priority.
+
+        Args:
+            entries (List[list]): The ``[-sort_key, sequence, appointment]`` queue entries.
+
+        Returns:
+            ColumnarAppointmentStore: The columnar store.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        if numpy is None:
+            raise ImportError("O armazenamento colunar requer o pacote numpy")
+        size = len(entries)
+        weights = numpy.fromiter((entry[-1].priority.weight for entry in entries), dtype=numpy.int8, count=size)
+        ages = numpy.fromiter((entry[-1].patient.age.age for entry in entries), dtype=numpy.uint8, count=size)
+        sort_keys = numpy.fromiter((-entry[0] for entry in entries), dtype=numpy.int64, count=size)
+        sequences = numpy.fromiter((entry[1] for entry in entries), dtype=numpy.int64, count=size)
+        encoded_names = [entry[-1].patient.name.encode('utf-8') for entry in entries]
+        name_offsets = numpy.zeros(size + 1, dtype=numpy.int64)
+        numpy.cumsum(numpy.fromiter(map(len, encoded_names), dtype=numpy.int64, count=size), out=name_offsets[1:])
+        return cls(weights, ages, sequences, name_offsets, b''.join(encoded_names), sort_keys)
+
+    def __len__(self) -> int:
+        """Returns the number of rows in the store.
+
+        Returns:
+            int: The number of appointments.
+        """
+        return len(self._weights)
+
+    def order(self):
+        """Computes the attendance order of the rows.
+
+        Rows are sorted by effective sort key in descending order, ties keeping
+        the arrival sequence.
+
+        Returns:
+            numpy.ndarray: The row indexes in attendance order.
+        """
+        return numpy.lexsort((self._sequences, -self._sort_keys))
+
+    def name(self, row: int) -> str:
+        """Gets the patient name of a row.
+
+        Args:
+            row (int): The row index.
+
+        Returns:
+            str: The name of the patient.
+        """
+        return self._names[self._name_offsets[row]:self._name_offsets[row + 1]].decode('utf-8')
+
+    def iter_names(self) -> Iterator[str]:
+        """Iterates the patient names in attendance order.
+
+        Returns:
+            Iterator[str]: The names of the patients.
+        """
+        for row in self.order().tolist():
+            yield self.name(row)
+
+    def to_appointments(self) -> List[MedicalAppointment]:
+        """Rebuilds the medical appointments in attendance order.
+
+        Returns:
+            List[MedicalAppointment]: The appointments in attendance order.
+        """
+        priority_names = {weight: name for name, weight in WEIGHT_PRIORITIES_LIST.items()}
+        weights = self._weights.tolist()
+        ages = self._ages.tolist()
+        return [
+            MedicalAppointment(Patient(self.name(row), Age.of(ages[row])), Priority.of(priority_names[weights[row]]))
+            for row in self.order().tolist()
+        ]
@@ -0,0 +1,415 @@
+import threading
+import time
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, TextIO, Union
+
+from entities.medical.AgingPolicy import AgingPolicy
+from entities.medical.ColumnarAppointmentStore import ColumnarAppointmentStore
+from entities.medical.MedicalAppointment import MedicalAppointment
+from entities.medical.MedicalManagementSystem import DEFAULT_QUEUE_ENGINE, MedicalManagementSystem
+from entities.patients.Priority import Priority
+
+DEFAULT_LOCK_STRIPES = 64
+
+class ConcurrentMedicalManagementSystem(MedicalManagementSystem):
+    """Thread-safe medical management system for many producers and consumers.
+
+    Duplicate checks only take one of several striped locks, chosen by the hash
+    of the appointment, so producers scheduling different patients never wait
+    on each other there. A single condition guards the queue engine itself,
+    which is held just for the O(log n) push or pop, and lets consumers block
+    until a patient arrives. Readers get snapshots and never see a half-updated
+    queue.
+
+    Attributes:
+        _stripes (List[threading.Lock]): The striped locks guarding the duplicate checks.
+        _condition (threading.Condition): The condition guarding the queue engine and signalling arrivals.
+    """
+    def __init__(self, name: str, engine: str = DEFAULT_QUEUE_ENGINE, lock_stripes: int = DEFAULT_LOCK_STRIPES):
+        """Initializes a ConcurrentMedicalManagementSystem instance.
+
+        Args:
+            name (str): The name of the medical management system.
+            engine (str): The queue engine, 'heap' (default) or 'bucket'.
+            lock_stripes (int): The number of striped locks used by the duplicate checks.
+
+        Raises:
+            ValueError: If the engine is not in QUEUE_ENGINES.
+        """
+        self._stripes: List[threading.Lock] = [threading.Lock() for _ in range(lock_stripes)]
+        self._condition: threading.Condition = threading.Condition()
+        super().__init__(name, engine)
+
+    def _stripe_of(self, medical_appointment: MedicalAppointment) -> threading.Lock:
+        """Gets the striped lock guarding the duplicate check of an appointment.
+
+        Args:
+            medical_appointment (MedicalAppointment): The medical appointment.
+
+        Returns:
+            threading.Lock: The striped lock.
+        """
+        return self._stripes[hash(medical_appointment) % len(self._stripes)]
+
+    def _reserve(self, medical_appointment: MedicalAppointment) -> bool:
+        """Atomically checks an appointment for duplicates and reserves its slot in the index.
+
+        Args:
+            medical_appointment (MedicalAppointment): The medical appointment to be reserved.
+
+        Returns:
+            bool: True if the slot was reserved, False if the appointment already exists.
+        """
+        with self._stripe_of(medical_appointment):
+            if medical_appointment in self._index:
+                return False
+            self._index[medical_appointment] = None
+            return True
+
+    def _release(self, medical_appointment: MedicalAppointment):
+        """Drops the reservation of an appointment that will not be queued after all.
+
+        Args:
+            medical_appointment (MedicalAppointment): The reserved medical appointment.
+        """
+        with self._stripe_of(medical_appointment):
+            if medical_appointment in self._index and self._index[medical_appointment] is None:
+                del self._index[medical_appointment]
+
+    def _rebuild(self, appointments: List[MedicalAppointment]):
+        """Rebuilds the queue engine and the indexes while holding every striped lock.
+
+        Reservations still in flight are carried over to the new index, and
+        their appointments are left to the producers that reserved them.
+
+        Args:
+            appointments (List[MedicalAppointment]): The appointments in arrival order, without duplicates.
+        """
+        for stripe in self._stripes:
+            stripe.acquire()
+        try:
+            pending = [medical_appointment for medical_appointment, handle in self._index.items() if handle is None]
+            reserved = set(pending)
+            super()._rebuild([medical_appointment for medical_appointment in appointments if medical_appointment not in reserved])
+            for medical_appointment in pending:
+                self._index[medical_appointment] = None
+        finally:
+            for stripe in self._stripes:
+                stripe.release()
+
+    @property
+    def appointments(self) -> List[MedicalAppointment]:
+        """Gets a snapshot of the medical appointments in attendance order.
+
+        Returns:
+            List[MedicalAppointment]: The list of scheduled appointments.
+        """
+        with self._condition:
+            return MedicalManagementSystem.appointments.fget(self)
+
+    @appointments.setter
+    def appointments(self, appointments: List[MedicalAppointment]):
+        """Sets the list of medical appointments.
+
+        Args:
+            appointments (List[MedicalAppointment]): The list of appointments to be set, in arrival order.
+        """
+        with self._condition:
+            MedicalManagementSystem.appointments.fset(self, appointments)
+            self._condition.notify_all()
+
+    def order_appointments(self):
+        """Restores the ordering by priority weight and patient age in descending order."""
+        with self._condition:
+            super().order_appointments()
+
+    def add_appointment(self, medical_appointment: MedicalAppointment) -> Optional[int]:
+        """Adds a medical appointment to the system and wakes one waiting consumer.
+
+        Args:
+            medical_appointment (MedicalAppointment): The medical appointment to be added.
+
+        Returns:
+            Optional[int]: The stable handle of the appointment, or None if it already exists.
+        """
+        if not self._reserve(medical_appointment):
+            return None
+        with self._condition:
+            handle = self._register(self._queue.push(medical_appointment))
+            self._mark_dirty()
+            self._condition.notify()
+        return handle
+
+    def add_appointments(self, medical_appointments: List[MedicalAppointment]) -> List[Optional[int]]:
+        """Adds a batch of medical appointments with a single merge and wakes the waiting consumers.
+
+        Args:
+            medical_appointments (List[MedicalAppointment]): The medical appointments to be added, in arrival order.
+
+        Returns:
+            List[Optional[int]]: For each appointment, its handle, or None if it already exists.
+        """
+        reserved = [self._reserve(medical_appointment) for medical_appointment in medical_appointments]
+        positions = [position for position, was_reserved in enumerate(reserved) if was_reserved]
+        results: List[Optional[int]] = [None] * len(medical_appointments)
+        if positions:
+            with self._condition:
+                entries = self._queue.extend([medical_appointments[position] for position in positions])
+                for position, entry in zip(positions, entries):
+                    results[position] = self._register(entry)
+                self._mark_dirty()
+                self._condition.notify_all()
+        return results
+
+    def pop_next(self, timeout: float = 0) -> MedicalAppointment:
+        """Removes and returns the next appointment, optionally waiting for one.
+
+        Args:
+            timeout (float): The seconds to wait for an appointment, 0 to return at once or None to wait forever.
+
+        Returns:
+            MedicalAppointment: The next appointment, or None if none arrived in time.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            while not self._queue:
+                if deadline is None:
+                    self._condition.wait()
+                    continue
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+                self._condition.wait(remaining)
+            return super().pop_next()
+
+    def compile_filter(self, sort_keys: Iterable[int]) -> object:
+        """Compiles the sort keys accepted by a consumer for pop_next_matching().
+
+        Args:
+            sort_keys (Iterable[int]): The accepted effective sort keys.
+
+        Returns:
+            object: The filter, specific to the queue engine.
+        """
+        with self._condition:
+            return super().compile_filter(sort_keys)
+
+    def pop_next_matching(self, key_filter: object) -> MedicalAppointment:
+        """Removes and returns the next appointment accepted by a filter.
+
+        Args:
+            key_filter (object): The filter returned by compile_filter().
+
+        Returns:
+            MedicalAppointment: The next accepted appointment, or None if there is none.
+        """
+        with self._condition:
+            return super().pop_next_matching(key_filter)
+
+    def cancel_appointment(self, medical_appointment: MedicalAppointment) -> bool:
+        """Removes a queued medical appointment.
+
+        An appointment whose insertion is still in flight counts as not queued yet.
+
+        Args:
+            medical_appointment (MedicalAppointment): The medical appointment to be cancelled.
+
+        Returns:
+            bool: True if the appointment was cancelled, False if it is not queued.
+        """
+        with self._condition:
+            if self._index.get(medical_appointment) is None:
+                return False
+            return super().cancel_appointment(medical_appointment)
+
+    def cancel(self, handle: int) -> bool:
+        """Removes a queued medical appointment by its handle.
+
+        Args:
+            handle (int): The handle returned by add_appointment().
+
+        Returns:
+            bool: True if the appointment was cancelled, False if it is no longer queued.
+        """
+        with self._condition:
+            return super().cancel(handle)
+
+    def reprioritize(self, handle: int, new_priority: Priority) -> bool:
+        """Changes the priority of a queued medical appointment in O(log n).
+
+        The appointment under its new priority is reserved through its striped
+        lock first, as add_appointment() does, so a producer adding the same
+        appointment meanwhile cannot queue it twice.
+
+        Args:
+            handle (int): The handle returned by add_appointment().
+            new_priority (Priority): The new priority of the appointment.
+
+        Returns:
+            bool: True if the priority changed.
+        """
+        with self._condition:
+            entry = self._handles.get(handle)
+            if entry is None or entry[-1].priority == new_priority:
+                return False
+            replacement = MedicalAppointment(entry[-1].patient, new_priority)
+            if not self._reserve(replacement):
+                return False
+            try:
+                self._requeue(handle, new_priority)
+            except BaseException:
+                self._release(replacement)
+                raise
+            return True
+
+    def get_appointment(self, handle: int) -> MedicalAppointment:
+        """Gets a queued medical appointment by its handle.
+
+        Args:
+            handle (int): The handle returned by add_appointment().
+
+        Returns:
+            MedicalAppointment: The appointment, or None if it is no longer queued.
+        """
+        with self._condition:
+            return super().get_appointment(handle)
+
+    def enable_name_search(self):
+        """Builds the patient name index and keeps it updated from now on."""
+        with self._condition:
+            super().enable_name_search()
+
+    def search_by_name(self, prefix: str) -> Dict[int, MedicalAppointment]:
+        """Finds the queued appointments whose patient name, or one of its words, starts with a prefix.
+
+        Args:
+            prefix (str): The name prefix.
+
+        Returns:
+            Dict[int, MedicalAppointment]: The matching appointments by handle.
+        """
+        with self._condition:
+            return super().search_by_name(prefix)
+
+    def enable_aging(self, aging_policy: AgingPolicy):
+        """Turns on anti-starvation aging.
+
+        Args:
+            aging_policy (AgingPolicy): The policy, owned by this system from now on.
+        """
+        with self._condition:
+            super().enable_aging(aging_policy)
+
+    def enable_position_tracking(self):
+        """Builds the queue position index and keeps it updated from now on."""
+        with self._condition:
+            super().enable_position_tracking()
+
+    def position_of(self, appointment: Union[int, MedicalAppointment]) -> Optional[int]:
+        """Gets the position of a queued appointment in attendance order.
+
+        Args:
+            appointment (Union[int, MedicalAppointment]): The appointment, or the handle returned by add_appointment().
+
+        Returns:
+            Optional[int]: The 1-based position, or None if it is not queued.
+        """
+        with self._condition:
+            return super().position_of(appointment)
+
+    def count_ahead(self, priority: Priority, age: int) -> int:
+        """Counts the appointments that would be served before a new arrival.
+
+        Args:
+            priority (Priority): The priority of the new arrival.
+            age (int): The age of the new arrival's patient.
+
+        Returns:
+            int: The number of queued appointments ahead of it.
+        """
+        with self._condition:
+            return super().count_ahead(priority, age)
+
+    def peek_next(self) -> MedicalAppointment:
+        """Returns the next appointment to be served without removing it.
+
+        Returns:
+            MedicalAppointment: The next appointment, or None if the queue is empty.
+        """
+        with self._condition:
+            return super().peek_next()
+
+    def iter_order(self, offset: int = 0, limit: int = None) -> Iterator[str]:
+        """Streams the patient names of a snapshot of the attendance order.
+
+        Args:
+            offset (int): The number of appointments to skip.
+            limit (int): The maximum number of names to yield, or None for all of them.
+
+        Returns:
+            Iterator[str]: The patient names in attendance order.
+        """
+        with self._condition:
+            if self._ordered is None and limit is not None:
+                names = list(super().iter_order(offset, limit))
+            else:
+                self._apply_aging()
+                if self._ordered is None:
+                    self._ordered = self._compute_order()
+                names = (appointment.patient.name for appointment in islice(self._ordered, offset, None if limit is None else offset + limit))
+        return iter(names)
+
+    def write_order(self, fileobj: TextIO, chunk_size: int = 1024) -> int:
+        """Writes a snapshot of the attendance order to a file, holding the lock while the queue is streamed.
+
+        Args:
+            fileobj (TextIO): The text file to be written.
+            chunk_size (int): The number of names joined per write.
+
+        Returns:
+            int: The number of names written.
+        """
+        with self._condition:
+            return super().write_order(fileobj, chunk_size)
+
+    def to_columnar(self) -> ColumnarAppointmentStore:
+        """Exports a snapshot of the queue as a NumPy-backed columnar store.
+
+        Returns:
+            ColumnarAppointmentStore: The snapshot.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        with self._condition:
+            return super().to_columnar()
+
+    def dump_binary(self, path: str) -> int:
+        """Writes a snapshot of the queue to a fixed-width binary snapshot.
+
+        Args:
+            path (str): The path of the snapshot file.
+
+        Returns:
+            int: The number of appointments written.
+        """
+        with self._condition:
+            return super().dump_binary(path)
+
+    def __len__(self) -> int:
+        """Returns the number of scheduled appointments.
+
+        Returns:
+            int: The number of appointments in the queue.
+        """
+        with self._condition:
+            return super().__len__()
+
+    def __str__(self) -> str:
+        """Returns a string representation of a snapshot of the appointment order.
+
+        Returns:
+            str: A comma-separated string of patient names in the order of appointments.
+        """
+        with self._condition:
+            return super().__str__()
@@ -0,0 +1,146 @@
+from typing import FrozenSet, Iterable, Iterator
+
+from entities.medical.MedicalAppointment import MedicalAppointment, pack_sort_key
+from entities.patients.Age import MAX_AGE, MIN_AGE
+from entities.patients.Priority import PRIORITIES_LIST, Priority
+
+class ConsultationRoom:
+    """Represents a doctor's consultation room, optionally restricted to priorities and an age band.
+
+    Attributes:
+        _name (str): The name of the room.
+        _priorities (FrozenSet[str]): The priority names the room serves.
+        _min_age (int): The youngest age the room serves.
+        _max_age (int): The oldest age the room serves.
+        _appointment (MedicalAppointment): The appointment in progress, None while the room is free.
+        _busy_since (float): When the appointment in progress started.
+        _busy_time (float): The total time spent on finished appointments.
+        _served (int): The number of finished appointments.
+    """
+    __slots__ = ('_name', '_priorities', '_min_age', '_max_age', '_appointment', '_busy_since', '_busy_time', '_served')
+
+    def __init__(self, name: str, priorities: Iterable[str] = None, min_age: int = MIN_AGE, max_age: int = MAX_AGE):
+        """Initializes a ConsultationRoom instance.
+
+        Args:
+            name (str): The name of the room.
+            priorities (Iterable[str]): The priority names the room serves, None for all of them.
+            min_age (int): The youngest age the room serves.
+            max_age (int): The oldest age the room serves.
+
+        Raises:
+            ValueError: If a priority name is not allowed or the age band is empty or out of limits.
+        """
+        if not MIN_AGE <= min_age <= max_age <= MAX_AGE:
+            raise ValueError("A faixa etária da sala é inválida")
+        self._name: str = name
+        self._priorities: FrozenSet[str] = frozenset(PRIORITIES_LIST if priorities is None else (Priority.of(priority).name for priority in priorities))
+        self._min_age: int = min_age
+        self._max_age: int = max_age
+        self._appointment: MedicalAppointment = None
+        self._busy_since: float = None
+        self._busy_time: float = 0.0
+        self._served: int = 0
+
+    @property
+    def name(self) -> str:
+        """Gets the name of the room.
+
+        Returns:
+            str: The name of the room.
+        """
+        return self._name
+
+    @property
+    def priorities(self) -> FrozenSet[str]:
+        """Gets the priority names the room serves.
+
+        Returns:
+            FrozenSet[str]: The priority names.
+        """
+        return self._priorities
+
+    @property
+    def appointment(self) -> MedicalAppointment:
+        """Gets the appointment in progress.
+
+        Returns:
+            MedicalAppointment: The appointment, or None while the room is free.
+        """
+        return self._appointment
+
+    @property
+    def busy(self) -> bool:
+        """Tells whether an appointment is in progress.
+
+        Returns:
+            bool: True if the room is busy.
+        """
+        return self._appointment is not None
+
+    @property
+    def served(self) -> int:
+        """Gets the number of finished appointments.
+
+        Returns:
+            int: The number of appointments.
+        """
+        return self._served
+
+    def sort_keys(self) -> Iterator[int]:
+        """Lists the sort keys of every appointment the room serves.
+
+        Returns:
+            Iterator[int]: The packed sort keys.
+        """
+        for name in self._priorities:
+            weight = Priority.of(name).weight
+            for age in range(self._min_age, self._max_age + 1):
+                yield pack_sort_key(weight, age)
+
+    def busy_time(self, now: float) -> float:
+        """Gets the time spent on appointments, including the one in progress.
+
+        Args:
+            now (float): The current time.
+
+        Returns:
+            float: The busy time.
+        """
+        return self._busy_time + (0.0 if self._busy_since is None else now - self._busy_since)
+
+    def start(self, medical_appointment: MedicalAppointment, now: float):
+        """Starts an appointment.
+
+        Args:
+            medical_appointment (MedicalAppointment): The appointment.
+            now (float): The current time.
+
+        Raises:
+            ValueError: If the room is busy.
+        """
+        if self.busy:
+            raise ValueError("A sala já está ocupada")
+        self._appointment = medical_appointment
+        self._busy_since = now
+
+    def finish(self, now: float) -> MedicalAppointment:
+        """Finishes the appointment in progress.
+
+        Args:
+            now (float): The current time.
+
+        Returns:
+            MedicalAppointment: The finished appointment.
+
+        Raises:
+            ValueError: If the room is free.
+        """
+        if not self.busy:
+            raise ValueError("A sala está livre")
+        medical_appointment = self._appointment
+        self._busy_time += now - self._busy_since
+        self._served += 1
+        self._appointment = None
+        self._busy_since = None
+        return medical_appointment
@@ -0,0 +1,195 @@
+from typing import List, Optional
+
+from entities.medical.MedicalAppointment import MedicalAppointment
+from entities.medical.MedicalManagementSystem import DEFAULT_QUEUE_ENGINE, MedicalManagementSystem
+from entities.patients.Age import Age
+from entities.patients.Patient import Patient
+from entities.patients.Priority import Priority
+from storage.WriteAheadLog import OPERATION_ADD, OPERATION_CANCEL, OPERATION_DISPATCH, WriteAheadLog
+
+REPLAY_BATCH_SIZE = 10000
+
+class DurableMedicalManagementSystem(MedicalManagementSystem):
+    """Medical management system that survives crashes through a write-ahead log.
+
+    Every add, dispatch and cancel is appended to the log (a reprioritization
+    is logged as a cancel followed by an add). Building the system replays the
+    last snapshot and the log tail back into the queue. Handles are not
+    durable: recovered appointments get new ones.
+
+    Attributes:
+        _write_ahead_log (WriteAheadLog): The log receiving every operation.
+        _checkpoint_every (int): The number of logged operations between automatic checkpoints, 0 to disable them.
+        _logged (int): The number of operations logged since the last checkpoint.
+    """
+    def __init__(self, name: str, write_ahead_log: WriteAheadLog, engine: str = DEFAULT_QUEUE_ENGINE, checkpoint_every: int = 0):
+        """Initializes a DurableMedicalManagementSystem instance, recovering the queue from the log.
+
+        Args:
+            name (str): The name of the medical management system.
+            write_ahead_log (WriteAheadLog): The log receiving every operation.
+            engine (str): The queue engine, 'heap' (default) or 'bucket'.
+            checkpoint_every (int): The number of logged operations between automatic checkpoints, 0 to disable them.
+
+        Raises:
+            ValueError: If the engine is not in QUEUE_ENGINES.
+        """
+        self._write_ahead_log: WriteAheadLog = None
+        self._checkpoint_every: int = checkpoint_every
+        self._logged: int = 0
+        super().__init__(name, engine)
+
+        self._replay(write_ahead_log)
+        write_ahead_log.open()
+        self._write_ahead_log = write_ahead_log
+
+    @property
+    def write_ahead_log(self) -> WriteAheadLog:
+        """Gets the write-ahead log.
+
+        Returns:
+            WriteAheadLog: The log receiving every operation.
+        """
+        return self._write_ahead_log
+
+    def _replay(self, write_ahead_log: WriteAheadLog):
+        """Rebuilds the queue from the logged operations, merging runs of additions in batches.
+
+        Args:
+            write_ahead_log (WriteAheadLog): The log to be replayed.
+        """
+        batch: List[MedicalAppointment] = []
+        for operation, name, age, priority in write_ahead_log.records():
+            medical_appointment = MedicalAppointment(Patient(name, Age.of(age)), Priority.of(priority))
+            if operation == OPERATION_ADD:
+                batch.append(medical_appointment)
+                if len(batch) >= REPLAY_BATCH_SIZE:
+                    super().add_appointments(batch)
+                    batch = []
+                continue
+            if batch:
+                super().add_appointments(batch)
+                batch = []
+            super().cancel_appointment(medical_appointment)
+        if batch:
+            super().add_appointments(batch)
+
+    def _log(self, operation: str, medical_appointment: MedicalAppointment):
+        """Appends an operation to the log and checkpoints when it is due.
+
+        Args:
+            operation (str): OPERATION_ADD, OPERATION_DISPATCH or OPERATION_CANCEL.
+            medical_appointment (MedicalAppointment): The medical appointment of the operation.
+        """
+        self._write_ahead_log.append(operation, medical_appointment)
+        self._logged += 1
+        if self._checkpoint_every and self._logged >= self._checkpoint_every:
+            self.checkpoint()
+
+    def checkpoint(self):
+        """Writes a snapshot of the queue so recovery only replays the log written after it."""
+        self._write_ahead_log.checkpoint(self.appointments)
+        self._logged = 0
+
+    @MedicalManagementSystem.appointments.setter
+    def appointments(self, appointments: List[MedicalAppointment]):
+        """Sets the list of medical appointments and checkpoints the new queue.
+
+        Args:
+            appointments (List[MedicalAppointment]): The list of appointments to be set, in arrival order.
+        """
+        MedicalManagementSystem.appointments.fset(self, appointments)
+        if self._write_ahead_log is not None:
+            self.checkpoint()
+
+    def add_appointment(self, medical_appointment: MedicalAppointment) -> Optional[int]:
+        """Adds and logs a medical appointment.
+
+        Args:
+            medical_appointment (MedicalAppointment): The medical appointment to be added.
+
+        Returns:
+            Optional[int]: The handle of the appointment, or None if it already exists.
+        """
+        handle = super().add_appointment(medical_appointment)
+        if handle is not None:
+            self._log(OPERATION_ADD, medical_appointment)
+        return handle
+
+    def add_appointments(self, medical_appointments: List[MedicalAppointment]) -> List[Optional[int]]:
+        """Adds and logs a batch of medical appointments.
+
+        Args:
+            medical_appointments (List[MedicalAppointment]): The medical appointments to be added, in arrival order.
+
+        Returns:
+            List[Optional[int]]: For each appointment, its handle, or None if it already exists.
+        """
+        handles = super().add_appointments(medical_appointments)
+        for medical_appointment, handle in zip(medical_appointments, handles):
+            if handle is not None:
+                self._log(OPERATION_ADD, medical_appointment)
+        return handles
+
+    def pop_next(self) -> MedicalAppointment:
+        """Removes, logs and returns the next appointment to be served.
+
+        Returns:
+            MedicalAppointment: The next appointment, or None if the queue is empty.
+        """
+        medical_appointment = super().pop_next()
+        if medical_appointment is not None:
+            self._log(OPERATION_DISPATCH, medical_appointment)
+        return medical_appointment
+
+    def pop_next_matching(self, key_filter: object) -> MedicalAppointment:
+        """Removes, logs and returns the next appointment accepted by a filter.
+
+        Args:
+            key_filter (object): The filter returned by compile_filter().
+
+        Returns:
+            MedicalAppointment: The next accepted appointment, or None if there is none.
+        """
+        medical_appointment = super().pop_next_matching(key_filter)
+        if medical_appointment is not None:
+            self._log(OPERATION_DISPATCH, medical_appointment)
+        return medical_appointment
+
+    def cancel_appointment(self, medical_appointment: MedicalAppointment) -> bool:
+        """Removes and logs a queued medical appointment.
+
+        Args:
+            medical_appointment (MedicalAppointment): The medical appointment to be cancelled.
+
+        Returns:
+            bool: True if the appointment was cancelled, False if it is not queued.
+        """
+        cancelled = super().cancel_appointment(medical_appointment)
+        if cancelled:
+            self._log(OPERATION_CANCEL, medical_appointment)
+        return cancelled
+
+    def reprioritize(self, handle: int, new_priority: Priority) -> bool:
+        """Changes and logs the priority of a queued medical appointment.
+
+        Args:
+            handle (int): The handle returned by add_appointment().
+            new_priority (Priority): The new priority of the appointment.
+
+        Returns:
+            bool: True if the priority changed.
+        """
+        medical_appointment = self.get_appointment(handle)
+        if medical_appointment is None:
+            return False
+        previous = MedicalAppointment(medical_appointment.patient, medical_appointment.priority)
+        changed = super().reprioritize(handle, new_priority)
+        if changed:
+            self._log(OPERATION_CANCEL, previous)
+            self._log(OPERATION_ADD, medical_appointment)
+        return changed
+
+    def close(self):
+        """Syncs and closes the write-ahead log."""
+        self._write_ahead_log.close()
@@ -1,6 +1,18 @@
+from entities.patients.Age import AGE_SPAN, MIN_AGE
 from entities.patients.Patient import Patient
 from entities.patients.Priority import Priority
 
+def pack_sort_key(weight: int, age: int) -> int:
+    """Packs a priority weight and a patient age into one integer, higher keys being served first.
+
+    Args:
+        weight (int): The priority weight.
+        age (int): The patient age.
+
+    Returns:
+        int: The packed sort key.
+    """
+    return weight * AGE_SPAN + age - MIN_AGE
 
 class MedicalAppointment:
     """Represents a medical appointment with a patient and associated priority.
@@ -8,7 +20,10 @@ class MedicalAppointment:
     Attributes:
         _patient (Patient): The patient associated with the appointment.
         _priority (Priority): The priority level of the appointment.
+        _sort_key (int): The packed priority weight and patient age, compiled whenever the patient or the priority is set.
     """
+    __slots__ = ('_patient', '_priority', '_sort_key')
+
     def __init__(self, patient: Patient, priority: Priority):
         """Initializes a MedicalAppointment instance.
 
@@ -18,6 +33,7 @@ class MedicalAppointment:
         """
         self._patient: Patient = None
         self._priority: Priority = None
+        self._sort_key: int = None
 
         self.patient = patient
         self.priority = priority
@@ -39,6 +55,7 @@ class MedicalAppointment:
             patient (Patient): The patient to be set.
         """
         self._patient = patient
+        self.compile_sort_key()
 
     @property
     def priority(self) -> Priority:
@@ -57,6 +74,21 @@ class MedicalAppointment:
             priority (Priority): The priority to be set.
         """
         self._priority = priority
+        self.compile_sort_key()
+
+    @property
+    def sort_key(self) -> int:
+        """Gets the packed sort key of the appointment.
+
+        Returns:
+            int: The key built by pack_sort_key(), higher keys being served first.
+        """
+        return self._sort_key
+
+    def compile_sort_key(self):
+        """Recomputes the packed sort key, needed only after the patient's age was mutated in place."""
+        if self._patient is not None and self._priority is not None:
+            self._sort_key = pack_sort_key(self._priority.weight, self._patient.age.age)
 
     def __eq__(self, value: 'MedicalAppointment') -> bool:
         """Checks if two MedicalAppointment instances are equal.
@@ -69,4 +101,15 @@ class MedicalAppointment:
         Returns:
             bool: True if the appointments are equal, False otherwise.
         """
-        return self.patient == value.patient and self.priority == value.priority
\ No newline at end of file
+        return self.patient == value.patient and self.priority == value.priority
+
+    def __hash__(self) -> int:
+        """Returns a hash consistent with __eq__.
+
+        Appointments must not be mutated while they are queued, otherwise the
+        duplicate index of the MedicalManagementSystem loses track of them.
+
+        Returns:
+            int: The hash of the patient and priority.
+        """
+        return hash((self.patient, self.priority))
\ No newline at end of file
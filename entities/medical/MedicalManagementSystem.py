@@ -1,25 +1,64 @@
-from typing import List
+from itertools import count, islice
+from typing import Dict, Iterable, Iterator, List, Optional, TextIO, Union
 
-from entities.medical.MedicalAppointment import MedicalAppointment
+from entities.medical.AgingPolicy import AgingPolicy
+from entities.medical.ColumnarAppointmentStore import ColumnarAppointmentStore
+from entities.medical.MedicalAppointment import MedicalAppointment, pack_sort_key
+from entities.medical.NameSearchIndex import NameSearchIndex
+from entities.medical.OrderStatisticsIndex import OrderStatisticsIndex
+from entities.medical.queues.BucketAppointmentQueue import BucketAppointmentQueue
+from entities.medical.queues.HeapAppointmentQueue import HeapAppointmentQueue
+from entities.patients.Priority import Priority
+from storage.BinarySnapshot import write_binary_snapshot
+
+QUEUE_ENGINES = {
+    'heap': HeapAppointmentQueue,
+    'bucket': BucketAppointmentQueue,
+}
+DEFAULT_QUEUE_ENGINE = 'heap'
+ORDER_HEADER = "Ordem de Atendimento: "
+ORDER_SEPARATOR = ", "
 
 class MedicalManagementSystem:
     """Manages a system for medical appointments, including scheduling and ordering.
 
     Attributes:
         _name (str): The name of the medical management system.
-        _appointments (List[MedicalAppointment]): The list of scheduled medical appointments.
+        _engine (str): The name of the queue engine, one of QUEUE_ENGINES.
+        _queue (Union[HeapAppointmentQueue, BucketAppointmentQueue]): The queue engine holding the scheduled medical appointments.
+        _index (Dict[MedicalAppointment, int]): The hash index of queued appointments and their handles, used to reject duplicates in O(1).
+        _handles (Dict[int, list]): The queue entry of each handle, used to cancel and reprioritize in O(log n).
+        _name_index (NameSearchIndex): The patient name index, None until enable_name_search() is called.
+        _positions (OrderStatisticsIndex): The queue position index, None until enable_position_tracking() is called.
+        _aging_policy (AgingPolicy): The anti-starvation policy, None until enable_aging() is called.
+        _ordered (List[MedicalAppointment]): The cached attendance order, None when the queue changed since it was computed.
+        _rendered (str): The cached string representation, None when the queue changed since it was rendered.
     """
-    def __init__(self, name: str):
+    def __init__(self, name: str, engine: str = DEFAULT_QUEUE_ENGINE, sequence: count = None):
         """Initializes a MedicalManagementSystem instance.
 
         Args:
             name (str): The name of the medical management system.
+            engine (str): The queue engine, 'heap' (default) or 'bucket'.
+            sequence (count): The arrival sequence generator, shared by systems whose queues are merged.
+
+        Raises:
+            ValueError: If the engine is not in QUEUE_ENGINES.
         """
+        if engine not in QUEUE_ENGINES:
+            raise ValueError("O motor de fila não foi encontrado")
         self._name: str = None
-        self._appointments: List[MedicalAppointment] = None
+        self._engine: str = engine
+        self._queue: Union[HeapAppointmentQueue, BucketAppointmentQueue] = QUEUE_ENGINES[engine](sequence)
+        self._index: Dict[MedicalAppointment, int] = {}
+        self._handles: Dict[int, list] = {}
+        self._name_index: NameSearchIndex = None
+        self._positions: OrderStatisticsIndex = None
+        self._aging_policy: AgingPolicy = None
+        self._ordered: List[MedicalAppointment] = None
+        self._rendered: str = None
 
         self.name = name
-        self.appointments = []
 
     @property
     def name(self) -> str:
@@ -39,56 +78,533 @@ class MedicalManagementSystem:
         """
         self._name = name
 
+    @property
+    def engine(self) -> str:
+        """Gets the name of the queue engine.
+
+        Returns:
+            str: The name of the queue engine.
+        """
+        return self._engine
+
     @property
     def appointments(self) -> List[MedicalAppointment]:
-        """Gets the list of medical appointments.
+        """Gets the list of medical appointments in attendance order.
+
+        The order is computed on the first read after a change and cached
+        until the next one.
 
         Returns:
             List[MedicalAppointment]: The list of scheduled appointments.
         """
-        return self._appointments
+        self._apply_aging()
+        if self._ordered is None:
+            self._ordered = self._compute_order()
+        return list(self._ordered)
     
     @appointments.setter
     def appointments(self, appointments: List[MedicalAppointment]):
         """Sets the list of medical appointments.
 
         Args:
-            appointments (List[MedicalAppointment]): The list of appointments to be set.
+            appointments (List[MedicalAppointment]): The list of appointments to be set, in arrival order.
         """
-        self._appointments = appointments
+        self._rebuild(list(dict.fromkeys(appointments)))
 
     def order_appointments(self):
-        """Sorts the appointments based on priority weight and patient age in descending order."""
+        """Restores the ordering by priority weight and patient age in descending order.
+
+        Only needed when a queued appointment was mutated in place, since the
+        queue engine keeps the order on every insertion.
+        """
         appointments = self.appointments
-        appointments = sorted(appointments, key=lambda appointment: (appointment.priority.weight, appointment.patient.age.age), reverse=True)
-        self.appointments = appointments
+        for medical_appointment in appointments:
+            medical_appointment.compile_sort_key()
+        self._rebuild(appointments)
 
-    def add_appointment(self, medical_appointment: MedicalAppointment) -> bool:
-        """Adds a medical appointment to the system and reorders the appointments.
+    def _compute_order(self) -> List[MedicalAppointment]:
+        """Sorts the queue into attendance order, called only when the cached order is stale.
+
+        Returns:
+            List[MedicalAppointment]: The appointments in attendance order.
+        """
+        return self._queue.ordered()
+
+    def _mark_dirty(self):
+        """Drops the cached order and rendering after the queue changed."""
+        self._ordered = None
+        self._rendered = None
+
+    def _rebuild(self, appointments: List[MedicalAppointment]):
+        """Rebuilds the queue engine and the indexes, keeping the handle of every appointment already queued.
+
+        Args:
+            appointments (List[MedicalAppointment]): The appointments in arrival order, without duplicates.
+        """
+        previous_handles = {id(entry[-1]): handle for handle, entry in self._handles.items()}
+        self._index = {}
+        self._handles = {}
+        for entry in self._queue.rebuild(appointments):
+            handle = previous_handles.get(id(entry[-1]))
+            if handle is None:
+                handle = entry[1]
+                if self._aging_policy is not None:
+                    self._aging_policy.track(handle)
+            self._index[entry[-1]] = handle
+            self._handles[handle] = entry
+        if self._name_index is not None:
+            self.enable_name_search()
+        if self._positions is not None:
+            self.enable_position_tracking()
+        self._mark_dirty()
+
+    def _register(self, entry: list, handle: int = None) -> int:
+        """Indexes a freshly queued entry.
+
+        A new handle is the arrival sequence of the entry, which starts at 1, so it is unique even
+        across systems sharing a sequence, and it survives reprioritization. New handles start
+        waiting for their aging promotions.
+
+        Args:
+            entry (list): The queue entry.
+            handle (int): The handle to be kept, or None for a new one.
+
+        Returns:
+            int: The handle of the appointment.
+        """
+        if handle is None:
+            handle = entry[1]
+            if self._aging_policy is not None:
+                self._aging_policy.track(handle)
+        self._index[entry[-1]] = handle
+        self._handles[handle] = entry
+        if self._name_index is not None:
+            self._name_index.add(handle, entry[-1].patient.name)
+        if self._positions is not None:
+            self._positions.add(-entry[0], entry[1])
+        return handle
+
+    def _unregister(self, medical_appointment: MedicalAppointment) -> list:
+        """Drops a queued appointment from the indexes.
+
+        Args:
+            medical_appointment (MedicalAppointment): The queued appointment.
+
+        Returns:
+            list: The queue entry of the appointment.
+        """
+        handle = self._index.pop(medical_appointment)
+        if self._name_index is not None:
+            self._name_index.remove(handle, medical_appointment.patient.name)
+        entry = self._handles.pop(handle)
+        if self._positions is not None:
+            self._positions.remove(-entry[0], entry[1])
+        return entry
+
+    def add_appointment(self, medical_appointment: MedicalAppointment) -> Optional[int]:
+        """Adds a medical appointment to the system in O(log n).
 
         Args:
             medical_appointment (MedicalAppointment): The medical appointment to be added.
 
         Returns:
-            bool: True if the appointment was added successfully, False if it already exists.
+            Optional[int]: The stable handle of the appointment, or None if it already exists.
+        """
+        if medical_appointment not in self._index:
+            handle = self._register(self._queue.push(medical_appointment))
+            self._mark_dirty()
+            return handle
+        return None
+
+    def add_appointments(self, medical_appointments: List[MedicalAppointment]) -> List[Optional[int]]:
+        """Adds a batch of medical appointments, deduplicating it in one pass and merging it into the queue at once.
+
+        Args:
+            medical_appointments (List[MedicalAppointment]): The medical appointments to be added, in arrival order.
+
+        Returns:
+            List[Optional[int]]: For each appointment, its handle, or None if it already exists.
+        """
+        index = self._index
+        accepted = []
+        positions = []
+        results = []
+        for medical_appointment in medical_appointments:
+            if medical_appointment in index:
+                results.append(None)
+            else:
+                index[medical_appointment] = None
+                accepted.append(medical_appointment)
+                positions.append(len(results))
+                results.append(None)
+        if accepted:
+            for position, entry in zip(positions, self._queue.extend(accepted)):
+                results[position] = self._register(entry)
+            self._mark_dirty()
+        return results
+
+    def to_columnar(self) -> ColumnarAppointmentStore:
+        """Exports the queue as a NumPy-backed columnar snapshot.
+
+        The entries are copied unordered, with the appointments' own priority
+        and age plus their effective keys and sequences, and the store's
+        lexsort computes the attendance order.
+
+        Returns:
+            ColumnarAppointmentStore: The snapshot.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        self._apply_aging()
+        return ColumnarAppointmentStore.from_entries(list(self._handles.values()))
+
+    def load_columnar(self, store: ColumnarAppointmentStore) -> List[Optional[int]]:
+        """Adds every appointment of a columnar snapshot, in its attendance order.
+
+        Args:
+            store (ColumnarAppointmentStore): The snapshot to be loaded.
+
+        Returns:
+            List[Optional[int]]: For each appointment, its handle, or None if it already exists.
+        """
+        return self.add_appointments(store.to_appointments())
+
+    def dump_binary(self, path: str) -> int:
+        """Writes the queue to a fixed-width binary snapshot, readable through storage.BinarySnapshot.MappedSnapshot.
+
+        Args:
+            path (str): The path of the snapshot file.
+
+        Returns:
+            int: The number of appointments written.
+        """
+        entries = list(self.iter_entries())
+        return write_binary_snapshot(path, [entry[-1] for entry in entries], [-entry[0] for entry in entries])
+
+    def pop_next(self) -> MedicalAppointment:
+        """Removes and returns the next appointment to be served.
+
+        Returns:
+            MedicalAppointment: The next appointment, or None if the queue is empty.
+        """
+        self._apply_aging()
+        if not self._queue:
+            return None
+        medical_appointment = self._queue.pop()
+        self._unregister(medical_appointment)
+        self._mark_dirty()
+        return medical_appointment
+
+    def compile_filter(self, sort_keys: Iterable[int]) -> object:
+        """Compiles the sort keys accepted by a consumer, such as a consultation room, for pop_next_matching().
+
+        Args:
+            sort_keys (Iterable[int]): The accepted sort keys, compared with MedicalAppointment.sort_key rather than the aged key.
+
+        Returns:
+            object: The filter, specific to the queue engine.
+        """
+        return self._queue.compile_filter(sort_keys)
+
+    def pop_next_matching(self, key_filter: object) -> MedicalAppointment:
+        """Removes and returns the next appointment accepted by a filter.
+
+        O(log n) on both engines whatever the filter, and O(1) when the filter
+        accepts no queued appointment. Filters match the appointments' own keys,
+        so aging never moves a patient out of the rooms that serve them.
+
+        Args:
+            key_filter (object): The filter returned by compile_filter().
+
+        Returns:
+            MedicalAppointment: The next accepted appointment, or None if there is none.
+        """
+        self._apply_aging()
+        medical_appointment = self._queue.pop_matching(key_filter)
+        if medical_appointment is None:
+            return None
+        self._unregister(medical_appointment)
+        self._mark_dirty()
+        return medical_appointment
+
+    def cancel_appointment(self, medical_appointment: MedicalAppointment) -> bool:
+        """Removes a queued medical appointment.
+
+        Args:
+            medical_appointment (MedicalAppointment): The medical appointment to be cancelled.
+
+        Returns:
+            bool: True if the appointment was cancelled, False if it is not queued.
+        """
+        if self._index.get(medical_appointment) is None:
+            return False
+        self._queue.remove(self._unregister(medical_appointment))
+        self._mark_dirty()
+        return True
+
+    def get_appointment(self, handle: int) -> MedicalAppointment:
+        """Gets a queued medical appointment by its handle.
+
+        Args:
+            handle (int): The handle returned by add_appointment().
+
+        Returns:
+            MedicalAppointment: The appointment, or None if it is no longer queued.
+        """
+        entry = self._handles.get(handle)
+        return None if entry is None else entry[-1]
+
+    def cancel(self, handle: int) -> bool:
+        """Removes a queued medical appointment by its handle in O(1) (lazy deletion).
+
+        Args:
+            handle (int): The handle returned by add_appointment().
+
+        Returns:
+            bool: True if the appointment was cancelled, False if it is no longer queued.
+        """
+        medical_appointment = self.get_appointment(handle)
+        if medical_appointment is None:
+            return False
+        return self.cancel_appointment(medical_appointment)
+
+    def reprioritize(self, handle: int, new_priority: Priority) -> bool:
+        """Changes the priority of a queued medical appointment in O(log n).
+
+        The old queue entry becomes a tombstone and the appointment is queued
+        again under its new key, behind the appointments that already share it.
+        The handle does not change.
+
+        Args:
+            handle (int): The handle returned by add_appointment().
+            new_priority (Priority): The new priority of the appointment.
+
+        Returns:
+            bool: True if the priority changed, False if the appointment is no longer queued, already has that priority or would duplicate another queued appointment.
+        """
+        entry = self._handles.get(handle)
+        if entry is None:
+            return False
+        medical_appointment = entry[-1]
+        if medical_appointment.priority == new_priority or MedicalAppointment(medical_appointment.patient, new_priority) in self._index:
+            return False
+        self._requeue(handle, new_priority)
+        return True
+
+    def _requeue(self, handle: int, new_priority: Priority):
+        """Moves a queued appointment to a new priority once reprioritize() has validated the change.
+
+        Args:
+            handle (int): The handle of the queued appointment.
+            new_priority (Priority): The new priority of the appointment.
+        """
+        medical_appointment = self._handles[handle][-1]
+        self._queue.remove(self._unregister(medical_appointment))
+        medical_appointment.priority = new_priority
+        self._register(self._queue.push(medical_appointment), handle)
+        self._mark_dirty()
+
+    def enable_name_search(self):
+        """Builds the patient name index and keeps it updated from now on.
+
+        Indexing costs a few dictionary steps per name character on every
+        insertion, so it is only maintained once enabled.
+        """
+        self._name_index = NameSearchIndex()
+        for handle, entry in self._handles.items():
+            self._name_index.add(handle, entry[-1].patient.name)
+
+    def search_by_name(self, prefix: str) -> Dict[int, MedicalAppointment]:
+        """Finds the queued appointments whose patient name, or one of its words, starts with a prefix.
+
+        Case and accents are ignored, so "joao" finds "João".
+
+        Args:
+            prefix (str): The name prefix.
+
+        Returns:
+            Dict[int, MedicalAppointment]: The matching appointments by handle.
+        """
+        if self._name_index is None:
+            self.enable_name_search()
+        return {handle: self._handles[handle][-1] for handle in self._name_index.search(prefix)}
+
+    def enable_aging(self, aging_policy: AgingPolicy):
+        """Turns on anti-starvation aging: every interval waited promotes an appointment one step.
+
+        See AgingPolicy for the steps: one priority tier at a time, then the top
+        key of the queue, where the appointment is served in promotion order.
+
+        Promotions only change the effective queue key, never the appointment's
+        own priority. Appointments already queued start waiting now, and
+        rebuilding the queue (order_appointments() or the appointments setter)
+        drops the promotions received so far.
+
+        Args:
+            aging_policy (AgingPolicy): The policy, owned by this system from now on.
+        """
+        aging_policy.clear()
+        self._aging_policy = aging_policy
+        for handle in sorted(self._handles):
+            aging_policy.track(handle)
+
+    def _apply_aging(self):
+        """Requeues the appointments whose promotion is due under their promoted key, in O(log n) each."""
+        aging_policy = self._aging_policy
+        if aging_policy is None:
+            return
+        promoted = False
+        for handle, promotions in aging_policy.due():
+            entry = self._handles.get(handle)
+            if entry is None:
+                continue
+            sort_key = aging_policy.promoted_key(-entry[0])
+            if sort_key is None:
+                continue
+            medical_appointment = entry[-1]
+            self._queue.remove(self._unregister(medical_appointment))
+            self._register(self._queue.push(medical_appointment, sort_key), handle)
+            aging_policy.track(handle, promotions + 1)
+            promoted = True
+        if promoted:
+            self._mark_dirty()
+
+    def enable_position_tracking(self):
+        """Builds the queue position index and keeps it updated from now on.
+
+        Tracking costs a Fenwick tree update on every insertion and removal,
+        so it is only maintained once enabled.
         """
-        if medical_appointment not in self.appointments:
-            appointments = self.appointments
-            appointments.append(medical_appointment)
-            self.appointments = appointments
-            self.order_appointments()
-            return True
-        return False
+        self._positions = OrderStatisticsIndex()
+        for entry in sorted(self._handles.values(), key=lambda entry: entry[1]):
+            self._positions.add(-entry[0], entry[1])
+
+    def position_of(self, appointment: Union[int, MedicalAppointment]) -> Optional[int]:
+        """Gets the position of a queued appointment in attendance order in O(log n).
+
+        Args:
+            appointment (Union[int, MedicalAppointment]): The appointment, or the handle returned by add_appointment().
+
+        Returns:
+            Optional[int]: The 1-based position, or None if it is not queued.
+        """
+        handle = appointment if isinstance(appointment, int) else self._index.get(appointment)
+        self._apply_aging()
+        entry = self._handles.get(handle)
+        if entry is None:
+            return None
+        if self._positions is None:
+            self.enable_position_tracking()
+        return self._positions.rank(-entry[0], entry[1]) + 1
+
+    def count_ahead(self, priority: Priority, age: int) -> int:
+        """Counts the appointments that would be served before a new arrival in O(log n).
+
+        Args:
+            priority (Priority): The priority of the new arrival.
+            age (int): The age of the new arrival's patient.
+
+        Returns:
+            int: The number of queued appointments ahead of it.
+        """
+        self._apply_aging()
+        if self._positions is None:
+            self.enable_position_tracking()
+        return self._positions.count_ahead(pack_sort_key(priority.weight, age))
+
+    def peek_next(self) -> MedicalAppointment:
+        """Returns the next appointment to be served without removing it.
+
+        Returns:
+            MedicalAppointment: The next appointment, or None if the queue is empty.
+        """
+        self._apply_aging()
+        if not self._queue:
+            return None
+        return self._queue.peek()
+
+    def iter_order(self, offset: int = 0, limit: int = None) -> Iterator[str]:
+        """Streams the patient names in attendance order.
+
+        A bounded page read before the order is cached walks the queue engine
+        lazily, so showing the next few patients never sorts the whole queue.
+
+        Args:
+            offset (int): The number of appointments to skip.
+            limit (int): The maximum number of names to yield, or None for all of them.
+
+        Returns:
+            Iterator[str]: The patient names in attendance order.
+        """
+        self._apply_aging()
+        stop = None if limit is None else offset + limit
+        if self._ordered is None and limit is None:
+            self._ordered = self._compute_order()
+        appointments = self._queue if self._ordered is None else self._ordered
+        for appointment in islice(appointments, offset, stop):
+            yield appointment.patient.name
+
+    def iter_entries(self) -> Iterator[list]:
+        """Lazily iterates the queue entries in attendance order.
+
+        Entries are ``[-sort_key, sequence, appointment]`` lists owned by the
+        queue engine; they sort in attendance order and must not be modified.
+
+        Returns:
+            Iterator[list]: The queue entries in attendance order.
+        """
+        self._apply_aging()
+        return self._queue.iter_entries()
+
+    def write_order(self, fileobj: TextIO, chunk_size: int = 1024) -> int:
+        """Writes the same text as __str__ to a file, a chunk of names at a time.
+
+        Without a cached order the names are streamed from the queue engine,
+        so an export neither sorts a copy of the queue nor fills the cache.
+
+        Args:
+            fileobj (TextIO): The text file to be written.
+            chunk_size (int): The number of names joined per write.
+
+        Returns:
+            int: The number of names written.
+        """
+        fileobj.write(ORDER_HEADER)
+        self._apply_aging()
+        if self._ordered is None:
+            names = (entry[-1].patient.name for entry in self._queue.iter_entries())
+        else:
+            names = (appointment.patient.name for appointment in self._ordered)
+        written = 0
+        chunk = list(islice(names, chunk_size))
+        while chunk:
+            if written:
+                fileobj.write(ORDER_SEPARATOR)
+            fileobj.write(ORDER_SEPARATOR.join(chunk))
+            written += len(chunk)
+            chunk = list(islice(names, chunk_size))
+        return written
+
+    def __len__(self) -> int:
+        """Returns the number of scheduled appointments.
+
+        Returns:
+            int: The number of appointments in the queue.
+        """
+        return len(self._queue)
 
     def __str__(self) -> str:
         """Returns a string representation of the appointment order.
 
+        The rendering is cached until the next change of the queue.
+
         Returns:
             str: A comma-separated string of patient names in the order of appointments.
         """
-        text = "Ordem de Atendimento: "
-        patient_names = []
-        for appointment in self.appointments:
-            patient_names.append(appointment.patient.name)
-        text += ", ".join(patient_names)
-        return text
\ No newline at end of file
+        self._apply_aging()
+        if self._rendered is None:
+            text = ORDER_HEADER
+            text += ORDER_SEPARATOR.join(self.iter_order())
+            self._rendered = text
+        return self._rendered
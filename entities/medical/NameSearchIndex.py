@@ -0,0 +1,129 @@
+import unicodedata
+from typing import Set
+
+# key of the handle set stored in a trie node, never a character
+TERMINAL = ''
+
+def normalize_name(name: str) -> str:
+    """Normalizes a name for searching: no accents, case-folded, single spaces.
+
+    Args:
+        name (str): The name to be normalized.
+
+    Returns:
+        str: The normalized name, e.g. "joao da silva" for "João  da Silva".
+    """
+    decomposed = unicodedata.normalize('NFKD', name)
+    stripped = ''.join(character for character in decomposed if not unicodedata.combining(character))
+    return ' '.join(stripped.casefold().split())
+
+class NameSearchIndex:
+    """Incremental prefix index over the names of queued patients.
+
+    Each handle is stored in a character trie under its whole normalized name
+    and under each of its words, so "silva" and "joao da" both find
+    "João da Silva". A prefix query walks the prefix and then only the subtree
+    below it, so its cost follows the size of the result, not of the queue.
+
+    Attributes:
+        _root (dict): The root node of the trie; nodes map characters to child nodes and TERMINAL to a set of handles.
+        _size (int): The number of indexed handles.
+    """
+    def __init__(self):
+        """Initializes an empty NameSearchIndex instance."""
+        self._root: dict = {}
+        self._size: int = 0
+
+    def _keys(self, name: str) -> Set[str]:
+        """Lists the trie keys of a name.
+
+        Args:
+            name (str): The patient name.
+
+        Returns:
+            Set[str]: The normalized name and each of its words.
+        """
+        normalized = normalize_name(name)
+        keys = set(normalized.split(' '))
+        keys.add(normalized)
+        keys.discard('')
+        return keys
+
+    def add(self, handle: int, name: str):
+        """Indexes a handle under a patient name.
+
+        Args:
+            handle (int): The handle of the appointment.
+            name (str): The patient name.
+        """
+        for key in self._keys(name):
+            node = self._root
+            for character in key:
+                node = node.setdefault(character, {})
+            node.setdefault(TERMINAL, set()).add(handle)
+        self._size += 1
+
+    def remove(self, handle: int, name: str):
+        """Removes a handle, pruning the trie nodes left empty.
+
+        Args:
+            handle (int): The handle of the appointment.
+            name (str): The patient name it was indexed under.
+        """
+        for key in self._keys(name):
+            path = [self._root]
+            for character in key:
+                node = path[-1].get(character)
+                if node is None:
+                    break
+                path.append(node)
+            else:
+                handles = path[-1].get(TERMINAL)
+                if handles is None or handle not in handles:
+                    continue
+                handles.discard(handle)
+                if not handles:
+                    del path[-1][TERMINAL]
+                for depth in range(len(key), 0, -1):
+                    if path[depth]:
+                        break
+                    del path[depth - 1][key[depth - 1]]
+        self._size -= 1
+
+    def search(self, prefix: str) -> Set[int]:
+        """Finds the handles whose name, or one of its words, starts with a prefix.
+
+        Args:
+            prefix (str): The prefix, normalized like the names.
+
+        Returns:
+            Set[int]: The matching handles.
+        """
+        node = self._root
+        for character in normalize_name(prefix):
+            node = node.get(character)
+            if node is None:
+                return set()
+        found: Set[int] = set()
+        pending = [node]
+        while pending:
+            node = pending.pop()
+            for character, child in node.items():
+                if character == TERMINAL:
+                    found.update(child)
+                else:
+                    pending.append(child)
+        return found
+
+    def clear(self):
+        """Removes every handle."""
+        self._root = {}
+        self._size = 0
+
+    def __len__(self) -> int:
+        """Returns the number of indexed handles.
+
+        Returns:
+            int: The number of handles.
+        """
+        return self._size
@@ -0,0 +1,143 @@
+from bisect import bisect_left
+from typing import Dict, List
+
+from entities.patients.Age import AGE_SPAN
+from entities.patients.Priority import WEIGHT_PRIORITIES_LIST
+
+# dispatched heads kept before a bucket list is compacted
+COMPACTION_THRESHOLD = 64
+
+class OrderStatisticsIndex:
+    """Answers queue position queries in O(log n) over the bounded space of packed sort keys.
+
+    A Fenwick tree counts the queued appointments of every key, ordered from
+    the key served first, so one prefix sum gives how many appointments have a
+    better key. Within a key, the arrival sequences are kept sorted (new
+    arrivals always have the largest one, so insertion is an append) and a
+    binary search gives how many arrived earlier.
+
+    Attributes:
+        _weight_ranks (Dict[int, int]): The rank of each priority weight, lowest weight first.
+        _tree (List[int]): The 1-based Fenwick tree over the keys, best key first.
+        _sequences (List[List[int]]): The sorted arrival sequences of each key.
+        _heads (List[int]): The number of dispatched sequences still at the front of each list.
+        _size (int): The number of indexed appointments.
+    """
+    def __init__(self):
+        """Initializes an empty OrderStatisticsIndex instance."""
+        weights = sorted(set(WEIGHT_PRIORITIES_LIST.values()))
+        self._weight_ranks: Dict[int, int] = {weight: rank for rank, weight in enumerate(weights)}
+        keys = len(weights) * AGE_SPAN
+        self._tree: List[int] = [0] * (keys + 1)
+        self._sequences: List[List[int]] = [[] for _ in range(keys)]
+        self._heads: List[int] = [0] * keys
+        self._size: int = 0
+
+    def _slot(self, sort_key: int) -> int:
+        """Computes the 0-based position of a key, the key served first being 0.
+
+        Args:
+            sort_key (int): The packed sort key.
+
+        Returns:
+            int: The position of the key.
+        """
+        weight, age = divmod(sort_key, AGE_SPAN)
+        return len(self._sequences) - 1 - (self._weight_ranks[weight] * AGE_SPAN + age)
+
+    def _update(self, slot: int, delta: int):
+        """Adds delta to the count of a key.
+
+        Args:
+            slot (int): The position of the key.
+            delta (int): The amount to be added.
+        """
+        tree = self._tree
+        index = slot + 1
+        while index < len(tree):
+            tree[index] += delta
+            index += index & -index
+
+    def _prefix(self, slot: int) -> int:
+        """Counts the appointments of the keys up to a position, inclusive.
+
+        Args:
+            slot (int): The position of the last key counted, -1 for none.
+
+        Returns:
+            int: The number of appointments.
+        """
+        tree = self._tree
+        index = slot + 1
+        total = 0
+        while index > 0:
+            total += tree[index]
+            index -= index & -index
+        return total
+
+    def add(self, sort_key: int, sequence: int):
+        """Indexes a queued appointment.
+
+        Args:
+            sort_key (int): The packed sort key.
+            sequence (int): The arrival sequence, larger than every other one of the key.
+        """
+        slot = self._slot(sort_key)
+        self._update(slot, 1)
+        self._sequences[slot].append(sequence)
+        self._size += 1
+
+    def remove(self, sort_key: int, sequence: int):
+        """Removes an indexed appointment.
+
+        Args:
+            sort_key (int): The packed sort key.
+            sequence (int): The arrival sequence.
+        """
+        slot = self._slot(sort_key)
+        sequences = self._sequences[slot]
+        head = self._heads[slot]
+        position = bisect_left(sequences, sequence, head)
+        if position == head:
+            head += 1
+            if head >= COMPACTION_THRESHOLD and head * 2 >= len(sequences):
+                del sequences[:head]
+                head = 0
+            self._heads[slot] = head
+        else:
+            del sequences[position]
+        self._update(slot, -1)
+        self._size -= 1
+
+    def count_ahead(self, sort_key: int) -> int:
+        """Counts the appointments served before a new arrival with a given key.
+
+        Args:
+            sort_key (int): The packed sort key.
+
+        Returns:
+            int: The number of appointments whose key is better than or equal to sort_key.
+        """
+        return self._prefix(self._slot(sort_key))
+
+    def rank(self, sort_key: int, sequence: int) -> int:
+        """Counts the appointments served before an indexed one.
+
+        Args:
+            sort_key (int): The packed sort key.
+            sequence (int): The arrival sequence.
+
+        Returns:
+            int: The number of appointments ahead of it.
+        """
+        slot = self._slot(sort_key)
+        head = self._heads[slot]
+        return self._prefix(slot - 1) + bisect_left(self._sequences[slot], sequence, head) - head
+
+    def __len__(self) -> int:
+        """Returns the number of indexed appointments.
+
+        Returns:
+            int: The number of appointments.
+        """
+        return self._size
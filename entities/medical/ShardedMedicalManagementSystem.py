@@ -0,0 +1,213 @@
+import heapq
+from itertools import count, islice
+from typing import Callable, Dict, Iterator, List, Optional
+
+from entities.medical.MedicalAppointment import MedicalAppointment
+from entities.patients.Priority import Priority
+from entities.medical.MedicalManagementSystem import (
+    DEFAULT_QUEUE_ENGINE,
+    ORDER_HEADER,
+    ORDER_SEPARATOR,
+    QUEUE_ENGINES,
+    MedicalManagementSystem,
+)
+
+class ShardedMedicalManagementSystem:
+    """Coordinates independent per-unit (or per-specialty) medical management systems.
+
+    Each shard is a regular MedicalManagementSystem, so writes to different
+    units never touch the same queue. All shards share one arrival sequence,
+    which makes their entries comparable, and the global attendance order is a
+    lazy heap merge of the shard orders that copies no shard list.
+
+    Attributes:
+        _name (str): The name of the network.
+        _engine (str): The queue engine of the shards.
+        _router (Callable[[MedicalAppointment], str]): The function choosing the shard of an appointment without an explicit one.
+        _sequence (count): The arrival sequence shared by every shard.
+        _shards (Dict[str, MedicalManagementSystem]): The shard of each unit name.
+    """
+    def __init__(self, name: str, router: Callable[[MedicalAppointment], str] = None, engine: str = DEFAULT_QUEUE_ENGINE):
+        """Initializes a ShardedMedicalManagementSystem instance.
+
+        Args:
+            name (str): The name of the network.
+            router (Callable[[MedicalAppointment], str]): The function choosing the shard of an appointment without an explicit one.
+            engine (str): The queue engine of the shards, 'heap' (default) or 'bucket'.
+
+        Raises:
+            ValueError: If the engine is not in QUEUE_ENGINES.
+        """
+        if engine not in QUEUE_ENGINES:
+            raise ValueError("O motor de fila não foi encontrado")
+        self._name: str = name
+        self._engine: str = engine
+        self._router: Callable[[MedicalAppointment], str] = router
+        self._sequence: count = count(1)
+        self._shards: Dict[str, MedicalManagementSystem] = {}
+
+    @property
+    def name(self) -> str:
+        """Gets the name of the network.
+
+        Returns:
+            str: The name of the network.
+        """
+        return self._name
+
+    @property
+    def shards(self) -> Dict[str, MedicalManagementSystem]:
+        """Gets the shards by unit name.
+
+        Returns:
+            Dict[str, MedicalManagementSystem]: A copy of the shard mapping.
+        """
+        return dict(self._shards)
+
+    def shard(self, shard_name: str) -> MedicalManagementSystem:
+        """Gets the shard of a unit, creating it on first use.
+
+        Args:
+            shard_name (str): The name of the unit.
+
+        Returns:
+            MedicalManagementSystem: The medical management system of the unit.
+        """
+        shard = self._shards.get(shard_name)
+        if shard is None:
+            shard = self._shards[shard_name] = MedicalManagementSystem(shard_name, self._engine, self._sequence)
+        return shard
+
+    def _route(self, medical_appointment: MedicalAppointment, shard_name: str) -> MedicalManagementSystem:
+        """Chooses the shard of an appointment.
+
+        Args:
+            medical_appointment (MedicalAppointment): The medical appointment.
+            shard_name (str): The explicit unit name, or None to use the router.
+
+        Returns:
+            MedicalManagementSystem: The shard.
+
+        Raises:
+            ValueError: If no unit name is given and there is no router.
+        """
+        if shard_name is None:
+            if self._router is None:
+                raise ValueError("A unidade do agendamento não foi informada")
+            shard_name = self._router(medical_appointment)
+        return self.shard(shard_name)
+
+    def add_appointment(self, medical_appointment: MedicalAppointment, shard_name: str = None) -> Optional[int]:
+        """Adds a medical appointment to its shard.
+
+        Duplicates are checked within the shard, so the same patient may wait in two units.
+
+        Args:
+            medical_appointment (MedicalAppointment): The medical appointment to be added.
+            shard_name (str): The unit name, or None to use the router.
+
+        Returns:
+            Optional[int]: The handle of the appointment, unique across shards, or None if it already exists in the shard.
+        """
+        return self._route(medical_appointment, shard_name).add_appointment(medical_appointment)
+
+    def add_appointments(self, medical_appointments: List[MedicalAppointment], shard_name: str = None) -> List[Optional[int]]:
+        """Adds a batch of medical appointments to their shards.
+
+        Appointments are inserted one by one so the shared arrival sequence
+        follows the batch order across shards.
+
+        Args:
+            medical_appointments (List[MedicalAppointment]): The medical appointments to be added, in arrival order.
+            shard_name (str): The unit name of the whole batch, or None to route each appointment.
+
+        Returns:
+            List[Optional[int]]: For each appointment, its handle, or None if it already exists in its shard.
+        """
+        if shard_name is not None:
+            return self.shard(shard_name).add_appointments(medical_appointments)
+        return [self.add_appointment(medical_appointment) for medical_appointment in medical_appointments]
+
+    def cancel(self, handle: int) -> bool:
+        """Removes a queued medical appointment by its handle, whatever its shard.
+
+        Args:
+            handle (int): The handle returned by add_appointment().
+
+        Returns:
+            bool: True if the appointment was cancelled, False if it is no longer queued.
+        """
+        return any(shard.cancel(handle) for shard in self._shards.values())
+
+    def reprioritize(self, handle: int, new_priority: Priority) -> bool:
+        """Changes the priority of a queued medical appointment by its handle, whatever its shard.
+
+        Args:
+            handle (int): The handle returned by add_appointment().
+            new_priority (Priority): The new priority of the appointment.
+
+        Returns:
+            bool: True if the priority changed.
+        """
+        for shard in self._shards.values():
+            if shard.get_appointment(handle) is not None:
+                return shard.reprioritize(handle, new_priority)
+        return False
+
+    def iter_entries(self) -> Iterator[list]:
+        """Lazily merges the queue entries of every shard in global attendance order.
+
+        Returns:
+            Iterator[list]: The queue entries in attendance order.
+        """
+        return heapq.merge(*(shard.iter_entries() for shard in self._shards.values()))
+
+    def iter_order(self, offset: int = 0, limit: int = None) -> Iterator[str]:
+        """Streams the patient names of the global attendance order.
+
+        Args:
+            offset (int): The number of appointments to skip.
+            limit (int): The maximum number of names to yield, or None for all of them.
+
+        Returns:
+            Iterator[str]: The patient names in attendance order.
+        """
+        stop = None if limit is None else offset + limit
+        for entry in islice(self.iter_entries(), offset, stop):
+            yield entry[-1].patient.name
+
+    def pop_next(self, shard_name: str = None) -> MedicalAppointment:
+        """Removes and returns the next appointment of a unit, or of the whole network.
+
+        Args:
+            shard_name (str): The unit name, or None for the best appointment across all shards.
+
+        Returns:
+            MedicalAppointment: The next appointment, or None if the queue is empty.
+        """
+        if shard_name is not None:
+            shard = self._shards.get(shard_name)
+            return None if shard is None else shard.pop_next()
+        best_entry = None
+        best_shard = None
+        for shard in self._shards.values():
+            entry = next(shard.iter_entries(), None)
+            if entry is not None and (best_entry is None or entry < best_entry):
+                best_entry, best_shard = entry, shard
+        return None if best_shard is None else best_shard.pop_next()
+
+    def __len__(self) -> int:
+        """Returns the number of appointments across every shard.
+
+        Returns:
+            int: The number of appointments in the network.
+        """
+        return sum(len(shard) for shard in self._shards.values())
+
+    def __str__(self) -> str:
+        """Returns a string representation of the global appointment order.
+
+        Returns:
+            str: A comma-separated string of patient names in the order of appointments.
+        """
+        return ORDER_HEADER + ORDER_SEPARATOR.join(self.iter_order())
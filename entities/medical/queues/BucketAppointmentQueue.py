@@ -0,0 +1,274 @@
+from collections import deque
+from itertools import count
+from typing import Deque, Dict, FrozenSet, Iterable, Iterator, List, Optional
+
+from entities.medical.MedicalAppointment import MedicalAppointment
+from entities.medical.queues.QueueFilter import QueueFilter
+from entities.patients.Age import AGE_SPAN
+from entities.patients.Priority import WEIGHT_PRIORITIES_LIST
+
+class BucketAppointmentQueue:
+    """Bounded bucket storage engine for medical appointments.
+
+    The ordering key (priority weight, patient age) only takes
+    ``len(WEIGHT_PRIORITIES_LIST) * AGE_SPAN`` values, so every key gets its own
+    FIFO bucket and an integer bitmap marks the non-empty ones. Insertion is
+    O(1) and dispatch takes the highest set bit of the bitmap. Entries have the
+    same ``[-sort_key, sequence, appointment]`` layout as the
+    HeapAppointmentQueue ones, and removed entries become tombstones. Filtered
+    pops go through QueueFilter views of the same entries.
+
+    Attributes:
+        _weight_ranks (Dict[int, int]): The rank of each priority weight, lowest weight first.
+        _buckets (List[Deque[list]]): The FIFO bucket of each key.
+        _alive (List[int]): The number of live entries in each bucket.
+        _bitmap (int): The bitmap of buckets holding live entries.
+        _size (int): The number of queued appointments.
+        _sequence (count): The arrival sequence generator.
+        _filters (Dict[FrozenSet[int], QueueFilter]): The compiled filters by accepted sort keys.
+    """
+    def __init__(self, sequence: count = None):
+        """Initializes an empty BucketAppointmentQueue instance.
+
+        Args:
+            sequence (count): The arrival sequence generator, shared when several queues must agree on arrival order.
+        """
+        weights = sorted(set(WEIGHT_PRIORITIES_LIST.values()))
+        self._weight_ranks: Dict[int, int] = {weight: rank for rank, weight in enumerate(weights)}
+        self._buckets: List[Deque[list]] = [deque() for _ in range(len(weights) * AGE_SPAN)]
+        self._alive: List[int] = [0] * len(self._buckets)
+        self._bitmap: int = 0
+        self._size: int = 0
+        self._sequence: count = count(1) if sequence is None else sequence
+        self._filters: Dict[FrozenSet[int], QueueFilter] = {}
+
+    def _bucket_of(self, entry: list) -> int:
+        """Computes the bucket index of an entry.
+
+        Args:
+            entry (list): The queue entry.
+
+        Returns:
+            int: The bucket index, higher indexes being served first.
+        """
+        weight, age = divmod(-entry[0], AGE_SPAN)
+        return self._weight_ranks[weight] * AGE_SPAN + age
+
+    def _top_bucket(self) -> int:
+        """Finds the non-empty bucket served first.
+
+        Returns:
+            int: The bucket index.
+
+        Raises:
+            IndexError: If the queue is empty.
+        """
+        if not self._bitmap:
+            raise IndexError("A fila de atendimento está vazia")
+        return self._bitmap.bit_length() - 1
+
+    def push(self, appointment: MedicalAppointment, sort_key: int = None) -> list:
+        """Inserts an appointment in O(1).
+
+        Args:
+            appointment (MedicalAppointment): The appointment to be inserted.
+            sort_key (int): The effective sort key, None for the appointment's own.
+
+        Returns:
+            list: The entry of the appointment, usable with remove().
+        """
+        entry = [-(appointment.sort_key if sort_key is None else sort_key), next(self._sequence), appointment]
+        bucket = self._bucket_of(entry)
+        self._buckets[bucket].append(entry)
+        self._alive[bucket] += 1
+        self._bitmap |= 1 << bucket
+        self._size += 1
+        for key_filter in self._filters.values():
+            key_filter.offer(entry)
+        return entry
+
+    def extend(self, appointments: List[MedicalAppointment]) -> List[list]:
+        """Inserts a batch of appointments in O(m).
+
+        Args:
+            appointments (List[MedicalAppointment]): The appointments in arrival order.
+
+        Returns:
+            List[list]: The entries of the appointments, usable with remove().
+        """
+        return [self.push(appointment) for appointment in appointments]
+
+    def pop(self) -> MedicalAppointment:
+        """Removes and returns the next appointment.
+
+        Returns:
+            MedicalAppointment: The next appointment to be served.
+
+        Raises:
+            IndexError: If the queue is empty.
+        """
+        return self._pop_bucket(self._top_bucket())
+
+    def _pop_bucket(self, bucket: int) -> MedicalAppointment:
+        """Removes and returns the oldest live appointment of a non-empty bucket.
+
+        Args:
+            bucket (int): The bucket index.
+
+        Returns:
+            MedicalAppointment: The appointment.
+        """
+        entries = self._buckets[bucket]
+        entry = entries.popleft()
+        while entry[-1] is None:
+            entry = entries.popleft()
+        self._alive[bucket] -= 1
+        self._size -= 1
+        if not self._alive[bucket]:
+            entries.clear()
+            self._bitmap &= ~(1 << bucket)
+        appointment = entry[-1]
+        if self._filters:
+            # the filters still hold the entry, so it becomes a tombstone there
+            for key_filter in self._filters.values():
+                key_filter.withdraw(entry)
+            entry[-1] = None
+        return appointment
+
+    def compile_filter(self, sort_keys: Iterable[int]) -> Optional[QueueFilter]:
+        """Compiles the sort keys accepted by a consumer into a filter, shared by consumers accepting the same keys.
+
+        The filter is maintained on every later insertion and removal, at
+        O(log n) each; a consumer accepting every key needs none.
+
+        Args:
+            sort_keys (Iterable[int]): The accepted sort keys, compared with the appointments' own keys.
+
+        Returns:
+            Optional[QueueFilter]: The filter, usable with pop_matching(), or None if every key is accepted.
+        """
+        sort_keys = frozenset(sort_keys)
+        if len(sort_keys) >= len(self._buckets):
+            return None
+        key_filter = self._filters.get(sort_keys)
+        if key_filter is None:
+            key_filter = self._filters[sort_keys] = QueueFilter(sort_keys, self.iter_entries())
+        return key_filter
+
+    def pop_matching(self, key_filter: Optional[QueueFilter]) -> Optional[MedicalAppointment]:
+        """Removes and returns the next appointment accepted by a filter in O(log n).
+
+        A filter that accepts no queued appointment is answered in O(1).
+
+        Args:
+            key_filter (Optional[QueueFilter]): The filter returned by compile_filter().
+
+        Returns:
+            Optional[MedicalAppointment]: The appointment, or None if no queued appointment is accepted.
+        """
+        if key_filter is None:
+            return self.pop() if self._size else None
+        entry = key_filter.peek()
+        if entry is None:
+            return None
+        appointment = entry[-1]
+        self.remove(entry)
+        return appointment
+
+    def peek(self) -> MedicalAppointment:
+        """Returns the next appointment without removing it.
+
+        Returns:
+            MedicalAppointment: The next appointment to be served.
+
+        Raises:
+            IndexError: If the queue is empty.
+        """
+        entries = self._buckets[self._top_bucket()]
+        while entries[0][-1] is None:
+            entries.popleft()
+        return entries[0][-1]
+
+    def remove(self, entry: list):
+        """Removes an entry in O(1) by turning it into a tombstone.
+
+        A bucket is compacted once tombstones outnumber its live entries.
+
+        Args:
+            entry (list): The entry returned by push() or extend().
+        """
+        if entry[-1] is None:
+            return
+        for key_filter in self._filters.values():
+            key_filter.withdraw(entry)
+        entry[-1] = None
+        bucket = self._bucket_of(entry)
+        entries = self._buckets[bucket]
+        self._alive[bucket] -= 1
+        self._size -= 1
+        if not self._alive[bucket]:
+            entries.clear()
+            self._bitmap &= ~(1 << bucket)
+        elif len(entries) > 2 * self._alive[bucket]:
+            self._buckets[bucket] = deque(entry for entry in entries if entry[-1] is not None)
+
+    def rebuild(self, appointments: List[MedicalAppointment]) -> List[list]:
+        """Replaces the queue content, recomputing every key in O(n).
+
+        Args:
+            appointments (List[MedicalAppointment]): The appointments in arrival order.
+
+        Returns:
+            List[list]: The new entries of the appointments.
+        """
+        self.clear()
+        return self.extend(appointments)
+
+    def clear(self):
+        """Removes every appointment from the queue."""
+        for entries in self._buckets:
+            entries.clear()
+        self._alive = [0] * len(self._buckets)
+        self._bitmap = 0
+        self._size = 0
+        for key_filter in self._filters.values():
+            key_filter.reset([])
+
+    def __len__(self) -> int:
+        """Returns the number of queued appointments.
+
+        Returns:
+            int: The size of the queue.
+        """
+        return self._size
+
+    def ordered(self) -> List[MedicalAppointment]:
+        """Lists every appointment in attendance order, bucket by bucket.
+
+        Returns:
+            List[MedicalAppointment]: The appointments in attendance order.
+        """
+        return list(self)
+
+    def __iter__(self) -> Iterator[MedicalAppointment]:
+        """Iterates the appointments in attendance order without modifying the buckets.
+
+        Returns:
+            Iterator[MedicalAppointment]: The appointments in attendance order.
+        """
+        for entry in self.iter_entries():
+            yield entry[-1]
+
+    def iter_entries(self) -> Iterator[list]:
+        """Iterates the live entries in attendance order without modifying the buckets.
+
+        Returns:
+            Iterator[list]: The live entries in attendance order.
+        """
+        bitmap = self._bitmap
+        while bitmap:
+            bucket = bitmap.bit_length() - 1
+            bitmap ^= 1 << bucket
+            for entry in self._buckets[bucket]:
+                if entry[-1] is not None:
+                    yield entry
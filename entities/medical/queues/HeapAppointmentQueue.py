@@ -0,0 +1,264 @@
+import heapq
+from itertools import count
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Optional
+
+from entities.medical.MedicalAppointment import MedicalAppointment
+from entities.medical.queues.QueueFilter import QueueFilter
+from entities.patients.Age import AGE_SPAN
+from entities.patients.Priority import WEIGHT_PRIORITIES_LIST
+
+
+class HeapAppointmentQueue:
+    """Binary-heap storage engine for medical appointments.
+
+    Entries are kept as ``[-sort_key, sequence, appointment]`` lists, comparing
+    the packed MedicalAppointment.sort_key as a single int, so the smallest entry is always the next appointment to be served and
+    the arrival sequence keeps the order stable among equal keys. Removed entries
+    become tombstones (their appointment slot is set to None) and are skipped or
+    compacted later. Each compiled QueueFilter keeps its own heap of the
+    entries it accepts, so filtered pops never walk the main heap.
+
+    Attributes:
+        _heap (List[list]): The heap of queue entries.
+        _sequence (count): The arrival sequence generator.
+        _removed (int): The number of tombstones still in the heap.
+        _filters (Dict[FrozenSet[int], QueueFilter]): The compiled filters by accepted sort keys.
+    """
+    def __init__(self, sequence: count = None):
+        """Initializes an empty HeapAppointmentQueue instance.
+
+        Args:
+            sequence (count): The arrival sequence generator, shared when several queues must agree on arrival order.
+        """
+        self._heap: List[list] = []
+        self._sequence: count = count(1) if sequence is None else sequence
+        self._removed: int = 0
+        self._filters: Dict[FrozenSet[int], QueueFilter] = {}
+
+    def _make_entry(self, appointment: MedicalAppointment, sort_key: int = None) -> list:
+        """Builds the heap entry of an appointment.
+
+        Args:
+            appointment (MedicalAppointment): The appointment to be wrapped.
+            sort_key (int): The effective sort key, None for the appointment's own.
+
+        Returns:
+            list: The heap entry of the appointment.
+        """
+        return [-(appointment.sort_key if sort_key is None else sort_key), next(self._sequence), appointment]
+
+    def _discard_top_tombstones(self):
+        """Pops the tombstones sitting at the top of the heap."""
+        heap = self._heap
+        while heap and heap[0][-1] is None:
+            heapq.heappop(heap)
+            self._removed -= 1
+
+    def push(self, appointment: MedicalAppointment, sort_key: int = None) -> list:
+        """Inserts an appointment in O(log n).
+
+        Args:
+            appointment (MedicalAppointment): The appointment to be inserted.
+            sort_key (int): The effective sort key, None for the appointment's own.
+
+        Returns:
+            list: The entry of the appointment, usable with remove().
+        """
+        entry = self._make_entry(appointment, sort_key)
+        heapq.heappush(self._heap, entry)
+        for key_filter in self._filters.values():
+            key_filter.offer(entry)
+        return entry
+
+    def extend(self, appointments: List[MedicalAppointment]) -> List[list]:
+        """Inserts a batch of appointments with a single merge.
+
+        Large batches are appended and heapified in O(n + m); batches that are
+        small compared to the queue are pushed one by one in O(m log n).
+
+        Args:
+            appointments (List[MedicalAppointment]): The appointments in arrival order.
+
+        Returns:
+            List[list]: The entries of the appointments, usable with remove().
+        """
+        heap = self._heap
+        entries = [self._make_entry(appointment) for appointment in appointments]
+        size = len(heap) + len(entries)
+        if len(entries) * size.bit_length() < size:
+            for entry in entries:
+                heapq.heappush(heap, entry)
+        else:
+            heap.extend(entries)
+            heapq.heapify(heap)
+        for key_filter in self._filters.values():
+            for entry in entries:
+                key_filter.offer(entry)
+        return entries
+
+    def pop(self) -> MedicalAppointment:
+        """Removes and returns the next appointment in O(log n).
+
+        Returns:
+            MedicalAppointment: The next appointment to be served.
+
+        Raises:
+            IndexError: If the queue is empty.
+        """
+        self._discard_top_tombstones()
+        entry = heapq.heappop(self._heap)
+        appointment = entry[-1]
+        if self._filters:
+            # the filters still hold the entry, so it becomes a tombstone there
+            for key_filter in self._filters.values():
+                key_filter.withdraw(entry)
+            entry[-1] = None
+        return appointment
+
+    def compile_filter(self, sort_keys: Iterable[int]) -> Optional[QueueFilter]:
+        """Compiles the sort keys accepted by a consumer into a filter, shared by consumers accepting the same keys.
+
+        The filter is maintained on every later insertion and removal, at
+        O(log n) each; a consumer accepting every key needs none.
+
+        Args:
+            sort_keys (Iterable[int]): The accepted sort keys, compared with the appointments' own keys.
+
+        Returns:
+            Optional[QueueFilter]: The filter, usable with pop_matching(), or None if every key is accepted.
+        """
+        sort_keys = frozenset(sort_keys)
+        if len(sort_keys) >= len(set(WEIGHT_PRIORITIES_LIST.values())) * AGE_SPAN:
+            return None
+        key_filter = self._filters.get(sort_keys)
+        if key_filter is None:
+            key_filter = self._filters[sort_keys] = QueueFilter(sort_keys, (entry for entry in self._heap if entry[-1] is not None))
+        return key_filter
+
+    def pop_matching(self, key_filter: Optional[QueueFilter]) -> Optional[MedicalAppointment]:
+        """Removes and returns the next appointment accepted by a filter in O(log n).
+
+        A filter that accepts no queued appointment is answered in O(1).
+
+        Args:
+            key_filter (Optional[QueueFilter]): The filter returned by compile_filter().
+
+        Returns:
+            Optional[MedicalAppointment]: The appointment, or None if no queued appointment is accepted.
+        """
+        if key_filter is None:
+            return self.pop() if len(self) else None
+        entry = key_filter.peek()
+        if entry is None:
+            return None
+        self._discard_top_tombstones()
+        if entry is self._heap[0]:
+            return self.pop()
+        appointment = entry[-1]
+        self.remove(entry)
+        return appointment
+
+    def peek(self) -> MedicalAppointment:
+        """Returns the next appointment without removing it.
+
+        Returns:
+            MedicalAppointment: The next appointment to be served.
+
+        Raises:
+            IndexError: If the queue is empty.
+        """
+        self._discard_top_tombstones()
+        return self._heap[0][-1]
+
+    def remove(self, entry: list):
+        """Removes an entry in O(1) by turning it into a tombstone.
+
+        The heap is compacted once tombstones make up half of it, so its size
+        stays proportional to the number of queued appointments.
+
+        Args:
+            entry (list): The entry returned by push() or extend().
+        """
+        if entry[-1] is None:
+            return
+        for key_filter in self._filters.values():
+            key_filter.withdraw(entry)
+        entry[-1] = None
+        self._removed += 1
+        if self._removed * 2 > len(self._heap):
+            self._heap = [entry for entry in self._heap if entry[-1] is not None]
+            heapq.heapify(self._heap)
+            self._removed = 0
+
+    def rebuild(self, appointments: List[MedicalAppointment]) -> List[list]:
+        """Replaces the queue content, recomputing every key in O(n).
+
+        Args:
+            appointments (List[MedicalAppointment]): The appointments in arrival order.
+
+        Returns:
+            List[list]: The new entries of the appointments.
+        """
+        entries = [self._make_entry(appointment) for appointment in appointments]
+        self._heap = list(entries)
+        self._removed = 0
+        heapq.heapify(self._heap)
+        for key_filter in self._filters.values():
+            key_filter.reset(entries)
+        return entries
+
+    def clear(self):
+        """Removes every appointment from the queue."""
+        self._heap = []
+        self._removed = 0
+        for key_filter in self._filters.values():
+            key_filter.reset([])
+
+    def __len__(self) -> int:
+        """Returns the number of queued appointments.
+
+        Returns:
+            int: The size of the queue.
+        """
+        return len(self._heap) - self._removed
+
+    def ordered(self) -> List[MedicalAppointment]:
+        """Lists every appointment in attendance order with a single sort.
+
+        Returns:
+            List[MedicalAppointment]: The appointments in attendance order.
+        """
+        return [entry[-1] for entry in sorted(self._heap) if entry[-1] is not None]
+
+    def __iter__(self) -> Iterator[MedicalAppointment]:
+        """Iterates the appointments in attendance order without modifying the heap.
+
+        Returns:
+            Iterator[MedicalAppointment]: The appointments in attendance order.
+        """
+        for entry in self.iter_entries():
+            yield entry[-1]
+
+    def iter_entries(self) -> Iterator[list]:
+        """Iterates the live entries in attendance order without modifying the heap.
+
+        The walk uses an auxiliary heap over the frontier of the tree, so reading
+        the first k entries costs O(k log k).
+
+        Returns:
+            Iterator[list]: The live entries in attendance order.
+        """
+        heap = self._heap
+        size = len(heap)
+        if not size:
+            return
+        frontier = [(heap[0], 0)]
+        while frontier:
+            entry, index = heapq.heappop(frontier)
+            if entry[-1] is not None:
+                yield entry
+            child = 2 * index + 1
+            if child < size:
+                heapq.heappush(frontier, (heap[child], child))
+            if child + 1 < size:
+                heapq.heappush(frontier, (heap[child + 1], child + 1))
@@ -0,0 +1,96 @@
+import heapq
+from typing import FrozenSet, Iterable, List, Optional
+
+
+class QueueFilter:
+    """Attendance-ordered view of the queue entries a consumer accepts.
+
+    Acceptance is decided on the appointment's own MedicalAppointment.sort_key,
+    so a consultation room keeps serving the patients it accepts after aging
+    promoted them, while the view is a heap of the shared queue entries and
+    thus follows their effective keys. Entries that leave the queue become
+    tombstones, which the view skips or compacts like the HeapAppointmentQueue.
+
+    Attributes:
+        _sort_keys (FrozenSet[int]): The accepted sort keys.
+        _heap (List[list]): The heap of accepted queue entries.
+        _alive (int): The number of live entries in the heap.
+    """
+    __slots__ = ('_sort_keys', '_heap', '_alive')
+
+    def __init__(self, sort_keys: FrozenSet[int], entries: Iterable[list] = ()):
+        """Initializes a QueueFilter instance.
+
+        Args:
+            sort_keys (FrozenSet[int]): The accepted sort keys.
+            entries (Iterable[list]): The live entries already queued.
+        """
+        self._sort_keys: FrozenSet[int] = sort_keys
+        self._heap: List[list] = [entry for entry in entries if entry[-1].sort_key in sort_keys]
+        self._alive: int = len(self._heap)
+        heapq.heapify(self._heap)
+
+    @property
+    def sort_keys(self) -> FrozenSet[int]:
+        """Gets the accepted sort keys.
+
+        Returns:
+            FrozenSet[int]: The sort keys.
+        """
+        return self._sort_keys
+
+    def __len__(self) -> int:
+        """Returns the number of queued appointments the filter accepts.
+
+        Returns:
+            int: The number of live entries.
+        """
+        return self._alive
+
+    def offer(self, entry: list):
+        """Adds a freshly queued entry in O(log n) if the filter accepts it.
+
+        Args:
+            entry (list): The queue entry.
+        """
+        if entry[-1].sort_key in self._sort_keys:
+            heapq.heappush(self._heap, entry)
+            self._alive += 1
+
+    def withdraw(self, entry: list):
+        """Accounts for an entry that is leaving the queue, before it becomes a tombstone.
+
+        The heap is compacted once tombstones make up half of it.
+
+        Args:
+            entry (list): The queue entry, still holding its appointment.
+        """
+        if entry[-1].sort_key not in self._sort_keys:
+            return
+        self._alive -= 1
+        if self._alive * 2 < len(self._heap):
+            self._heap = [other for other in self._heap if other[-1] is not None and other is not entry]
+            heapq.heapify(self._heap)
+
+    def peek(self) -> Optional[list]:
+        """Finds the accepted entry served first, in O(1) when none is queued.
+
+        Returns:
+            Optional[list]: The live entry, or None if the filter accepts no queued appointment.
+        """
+        if not self._alive:
+            return None
+        heap = self._heap
+        while heap[0][-1] is None:
+            heapq.heappop(heap)
+        return heap[0]
+
+    def reset(self, entries: Iterable[list]):
+        """Refills the view after the queue was rebuilt or cleared.
+
+        Args:
+            entries (Iterable[list]): The live queue entries.
+        """
+        self._heap = [entry for entry in entries if entry[-1].sort_key in self._sort_keys]
+        self._alive = len(self._heap)
+        heapq.heapify(self._heap)
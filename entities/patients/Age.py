@@ -1,5 +1,8 @@
+from typing import Dict
+
 MIN_AGE = 0
 MAX_AGE = 120
+AGE_SPAN = MAX_AGE - MIN_AGE + 1
 
 class Age:
     """Represents a person's age with validation for minimum and maximum limits.
@@ -7,6 +10,8 @@ class Age:
     Attributes:
         _age (int): The age value.
     """
+    __slots__ = ('_age',)
+
     def __init__(self, age: int):
         """Initializes an Age instance.
 
@@ -17,6 +22,27 @@ class Age:
 
         self.age = age
     
+    @classmethod
+    def of(cls, age: int) -> 'Age':
+        """Gets the shared Age instance of an age value.
+
+        Only MAX_AGE - MIN_AGE + 1 ages exist, so instances are interned and
+        reused by every patient. Shared instances must not be mutated.
+
+        Args:
+            age (int): The age value.
+
+        Returns:
+            Age: The interned Age instance.
+
+        Raises:
+            ValueError: If the age is negative or exceeds the maximum limit.
+        """
+        instance = _AGES.get(age)
+        if instance is None:
+            instance = _AGES[age] = cls(age)
+        return instance
+
     @property
     def age(self) -> int:
         """Gets the age value.
@@ -59,4 +85,14 @@ class Age:
         Returns:
             bool: True if the ages are equal, False otherwise.
         """
-        return self.age == value.age
\ No newline at end of file
+        return self.age == value.age
+
+    def __hash__(self) -> int:
+        """Returns a hash consistent with __eq__.
+
+        Returns:
+            int: The hash of the age value.
+        """
+        return hash(self.age)
+
+_AGES: Dict[int, Age] = {}
\ No newline at end of file
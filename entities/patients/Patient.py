@@ -7,6 +7,8 @@ class Patient:
         _name (str): The name of the patient.
         _age (Age): The age of the patient.
     """
+    __slots__ = ('_name', '_age')
+
     def __init__(self, name: str, age: Age):
         """Initializes a Patient instance.
 
@@ -75,4 +77,12 @@ class Patient:
         Returns:
             bool: True if the patients are equal, False otherwise.
         """
-        return self.name == value.name and self.age == value.age
\ No newline at end of file
+        return self.name == value.name and self.age == value.age
+
+    def __hash__(self) -> int:
+        """Returns a hash consistent with __eq__.
+
+        Returns:
+            int: The hash of the patient name and age.
+        """
+        return hash((self.name, self.age))
\ No newline at end of file
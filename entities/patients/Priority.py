@@ -1,3 +1,5 @@
+from typing import Dict
+
 PRIORITIES_LIST = ['normal', 'urgente']
 WEIGHT_PRIORITIES_LIST = {
     'normal': 0,
@@ -8,10 +10,15 @@ DEFAULT_PRIORITY = 'normal'
 class Priority:
     """Represents a priority level for a medical appointment.
 
+    The accepted levels default to PRIORITIES_LIST and can be replaced at
+    startup through entities.patients.PriorityScheme.
+
     Attributes:
         _name (str): The name of the priority level.
         _weight (int): The weight associated with the priority level.
     """
+    __slots__ = ('_name', '_weight')
+
     def __init__(self, name: str):
         """Initializes a Priority instance.
 
@@ -24,6 +31,27 @@ class Priority:
         self.name = name
         self.weight = WEIGHT_PRIORITIES_LIST[name] if name in WEIGHT_PRIORITIES_LIST else WEIGHT_PRIORITIES_LIST[DEFAULT_PRIORITY]
 
+    @classmethod
+    def of(cls, name: str) -> 'Priority':
+        """Gets the shared Priority instance of a priority name.
+
+        Instances are interned and reused by every appointment. Shared
+        instances must not be mutated.
+
+        Args:
+            name (str): The name of the priority level.
+
+        Returns:
+            Priority: The interned Priority instance.
+
+        Raises:
+            ValueError: If the priority name is not in the allowed priorities list.
+        """
+        instance = _PRIORITIES.get(name)
+        if instance is None:
+            instance = _PRIORITIES[name] = cls(name)
+        return instance
+
     @property
     def name(self) -> str:
         """Gets the name of the priority level.
@@ -76,4 +104,14 @@ class Priority:
         Returns:
             bool: True if the priorities are equal, False otherwise.
         """
-        return self.name == value.name and self.weight == value.weight
\ No newline at end of file
+        return self.name == value.name and self.weight == value.weight
+
+    def __hash__(self) -> int:
+        """Returns a hash consistent with __eq__.
+
+        Returns:
+            int: The hash of the priority name and weight.
+        """
+        return hash((self.name, self.weight))
+
+_PRIORITIES: Dict[str, Priority] = {}
\ No newline at end of file
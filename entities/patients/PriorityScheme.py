@@ -0,0 +1,102 @@
+import json
+from typing import Dict
+
+import entities.patients.Priority as priority_module
+
+# weights are stored as signed bytes by the binary and columnar snapshots
+MIN_WEIGHT = -128
+MAX_WEIGHT = 127
+
+class PriorityScheme:
+    """Represents a set of triage priority levels and their weights.
+
+    Installing a scheme replaces the priorities accepted by Priority, so it must
+    happen at startup, before any appointment or medical management system is
+    created. Higher weights are served first.
+
+    Attributes:
+        _weights (Dict[str, int]): The weight of each priority name.
+        _default (str): The priority name used when none is given.
+    """
+    __slots__ = ('_weights', '_default')
+
+    def __init__(self, weights: Dict[str, int], default: str):
+        """Initializes a PriorityScheme instance.
+
+        Args:
+            weights (Dict[str, int]): The weight of each priority name.
+            default (str): The priority name used when none is given.
+
+        Raises:
+            ValueError: If the scheme has no levels, has a weight outside MIN_WEIGHT..MAX_WEIGHT, repeats a weight or the default is not one of its levels.
+        """
+        if not weights:
+            raise ValueError("O esquema de prioridades não possui níveis")
+        if any(not MIN_WEIGHT <= weight <= MAX_WEIGHT for weight in weights.values()):
+            raise ValueError(f"Os pesos do esquema de prioridades devem estar entre {MIN_WEIGHT} e {MAX_WEIGHT}")
+        if len(set(weights.values())) != len(weights):
+            raise ValueError("O esquema de prioridades repete um peso")
+        if default not in weights:
+            raise ValueError("A prioridade padrão não pertence ao esquema")
+        self._weights: Dict[str, int] = dict(weights)
+        self._default: str = default
+
+    @classmethod
+    def from_file(cls, path: str) -> 'PriorityScheme':
+        """Loads a scheme from a JSON file such as ``{"priorities": {"normal": 0, "urgente": 1}, "default": "normal"}``.
+
+        Args:
+            path (str): The path of the JSON file.
+
+        Returns:
+            PriorityScheme: The loaded scheme.
+
+        Raises:
+            ValueError: If the file does not describe a valid scheme.
+        """
+        with open(path, encoding='utf-8') as file:
+            document = json.load(file)
+        return cls({name: int(weight) for name, weight in document['priorities'].items()}, document['default'])
+
+    @classmethod
+    def current(cls) -> 'PriorityScheme':
+        """Gets the scheme currently installed.
+
+        Returns:
+            PriorityScheme: The installed scheme.
+        """
+        return cls(priority_module.WEIGHT_PRIORITIES_LIST, priority_module.DEFAULT_PRIORITY)
+
+    @property
+    def weights(self) -> Dict[str, int]:
+        """Gets the weight of each priority name.
+
+        Returns:
+            Dict[str, int]: A copy of the weights.
+        """
+        return dict(self._weights)
+
+    @property
+    def default(self) -> str:
+        """Gets the priority name used when none is given.
+
+        Returns:
+            str: The default priority name.
+        """
+        return self._default
+
+    def install(self):
+        """Makes this scheme the one accepted by Priority.
+
+        The priority tables are updated in place, so modules that imported them
+        see the new levels, and interned Priority instances are dropped.
+        """
+        priority_module.PRIORITIES_LIST[:] = sorted(self._weights, key=self._weights.get)
+        priority_module.WEIGHT_PRIORITIES_LIST.clear()
+        priority_module.WEIGHT_PRIORITIES_LIST.update(self._weights)
+        priority_module.DEFAULT_PRIORITY = self._default
+        priority_module._PRIORITIES.clear()
+
+DEFAULT_SCHEME = PriorityScheme({'normal': 0, 'urgente': 1}, 'normal')
+# Protocolo de Manchester: do não urgente (azul) ao emergente (vermelho)
+MANCHESTER_SCHEME = PriorityScheme({'azul': 0, 'verde': 1, 'amarelo': 2, 'laranja': 3, 'vermelho': 4}, 'azul')
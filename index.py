@@ -1,19 +1,30 @@
+import sys
+
 from entities.medical.MedicalManagementSystem import MedicalManagementSystem
 from services.MedicalManagementSystemService import MedicalManagementSystemService
+from entities.patients.PriorityScheme import PriorityScheme
+from services.MedicalStreamService import MedicalStreamService
+
+if '--priorities' in sys.argv[1:]:
+    # Esquema de triagem carregado de um arquivo JSON antes de criar o sistema
+    PriorityScheme.from_file(sys.argv[sys.argv.index('--priorities') + 1]).install()
 
 medical_management_system: MedicalManagementSystem = MedicalManagementSystem('Sistema de Teste')
 
 medical_management_system_service: MedicalManagementSystemService = MedicalManagementSystemService(medical_management_system)
 
+if '--stream' in sys.argv[1:]:
+    # Modo contínuo: chegadas, "next" e "cancel" lidos linha a linha
+    medical_stream_service: MedicalStreamService = MedicalStreamService(medical_management_system_service)
+    for response in medical_stream_service.process(sys.stdin):
+        print(response, flush=True)
+    sys.exit(0)
+
 # Entrada do número de pacientes
 n = int(input().strip())
 
-for _ in range(n):
-    name, age, status = input().strip().split(", ")
-    age = int(age)
-    medical_management_system_service.make_an_appointment(name, age, status)
-    
-print(medical_management_system)
-    
-
+# Linhas inválidas são relatadas na saída de erro sem interromper a execução
+for row_error in medical_management_system_service.make_appointments_from_lines([input() for _ in range(n)]):
+    print(row_error, file=sys.stderr)
 
+print(medical_management_system)
@@ -0,0 +1,108 @@
+import asyncio
+
+from entities.medical.MedicalAppointment import MedicalAppointment
+from entities.medical.MedicalManagementSystem import MedicalManagementSystem
+from services.MedicalManagementSystemService import MedicalManagementSystemService
+
+class AsyncMedicalManagementSystemService:
+    """Asyncio counterpart of MedicalManagementSystemService with backpressure.
+
+    Producers suspend while the queue holds max_size appointments and consumers
+    suspend until a patient is available, so a single event loop can serve
+    many intake coroutines without threads.
+
+    Attributes:
+        _medical_management_system_service (MedicalManagementSystemService): The synchronous service that builds and schedules the appointments.
+        _max_size (int): The maximum number of queued appointments, 0 for unbounded.
+        _lock (asyncio.Lock): The lock shared by both conditions.
+        _not_empty (asyncio.Condition): The condition signalled when an appointment is added.
+        _not_full (asyncio.Condition): The condition signalled when an appointment leaves the queue.
+    """
+    def __init__(self, medical_management_system: MedicalManagementSystem, max_size: int = 0):
+        """Initializes an AsyncMedicalManagementSystemService instance.
+
+        Args:
+            medical_management_system (MedicalManagementSystem): The medical management system to be used.
+            max_size (int): The maximum number of queued appointments, 0 for unbounded.
+        """
+        self._medical_management_system_service: MedicalManagementSystemService = MedicalManagementSystemService(medical_management_system)
+        self._max_size: int = max_size
+        self._lock: asyncio.Lock = asyncio.Lock()
+        self._not_empty: asyncio.Condition = asyncio.Condition(self._lock)
+        self._not_full: asyncio.Condition = asyncio.Condition(self._lock)
+
+    @property
+    def medical_management_system(self) -> MedicalManagementSystem:
+        """Gets the medical management system instance.
+
+        Returns:
+            MedicalManagementSystem: The medical management system.
+        """
+        return self._medical_management_system_service.medical_management_system
+
+    @property
+    def max_size(self) -> int:
+        """Gets the maximum number of queued appointments.
+
+        Returns:
+            int: The maximum queue size, 0 for unbounded.
+        """
+        return self._max_size
+
+    def _is_full(self) -> bool:
+        """Checks whether producers must wait for room in the queue.
+
+        Returns:
+            bool: True if the queue reached max_size.
+        """
+        return 0 < self._max_size <= len(self.medical_management_system)
+
+    async def make_an_appointment(self, patient_name: str, patient_age: int, priority: str) -> bool:
+        """Creates and schedules a new medical appointment, waiting while the queue is full.
+
+        Args:
+            patient_name (str): The name of the patient.
+            patient_age (int): The age of the patient.
+            priority (str): The priority level of the appointment.
+
+        Returns:
+            bool: True if the appointment was successfully added, False if it already exists.
+
+        Raises:
+            ValueError: If the age or the priority is invalid.
+        """
+        async with self._lock:
+            await self._not_full.wait_for(lambda: not self._is_full())
+            added = self._medical_management_system_service.make_an_appointment(patient_name, patient_age, priority)
+            if added:
+                self._not_empty.notify()
+            return added
+
+    async def cancel_an_appointment(self, patient_name: str, patient_age: int, priority: str) -> bool:
+        """Cancels a scheduled medical appointment, making room for a waiting producer.
+
+        Args:
+            patient_name (str): The name of the patient.
+            patient_age (int): The age of the patient.
+            priority (str): The priority level of the appointment.
+
+        Returns:
+            bool: True if the appointment was cancelled, False if it is not scheduled.
+        """
+        async with self._lock:
+            cancelled = self._medical_management_system_service.cancel_an_appointment(patient_name, patient_age, priority)
+            if cancelled:
+                self._not_full.notify()
+            return cancelled
+
+    async def next_patient(self) -> MedicalAppointment:
+        """Removes and returns the next appointment, waiting until one is available.
+
+        Returns:
+            MedicalAppointment: The next appointment to be served.
+        """
+        async with self._lock:
+            await self._not_empty.wait_for(lambda: len(self.medical_management_system) > 0)
+            medical_appointment = self.medical_management_system.pop_next()
+            self._not_full.notify()
+            return medical_appointment
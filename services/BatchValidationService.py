@@ -0,0 +1,160 @@
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from entities.medical.MedicalAppointment import MedicalAppointment
+from entities.patients.Age import MAX_AGE, MIN_AGE, Age
+from entities.patients.Patient import Patient
+from entities.patients.Priority import PRIORITIES_LIST, Priority
+
+REASON_MALFORMED = "Linha malformada"
+REASON_INVALID_AGE = f"Idade inválida, deve ser um inteiro de {MIN_AGE} a {MAX_AGE}"
+REASON_INVALID_PRIORITY = "Prioridade não encontrada"
+
+class RowError:
+    """Represents a rejected input row.
+
+    Attributes:
+        _row (int): The 1-based number of the row.
+        _reason (str): Why the row was rejected, one of the REASON_* messages.
+    """
+    __slots__ = ('_row', '_reason')
+
+    def __init__(self, row: int, reason: str):
+        """Initializes a RowError instance.
+
+        Args:
+            row (int): The 1-based number of the row.
+            reason (str): Why the row was rejected.
+        """
+        self._row: int = row
+        self._reason: str = reason
+
+    @property
+    def row(self) -> int:
+        """Gets the number of the rejected row.
+
+        Returns:
+            int: The 1-based number of the row.
+        """
+        return self._row
+
+    @property
+    def reason(self) -> str:
+        """Gets why the row was rejected.
+
+        Returns:
+            str: The reason message.
+        """
+        return self._reason
+
+    def __str__(self) -> str:
+        """Returns a string representation of the error.
+
+        Returns:
+            str: The row number and the reason.
+        """
+        return f"Linha {self.row}: {self.reason}"
+
+class BatchValidationService:
+    """Validates batches of appointment rows without raising an exception per bad row.
+
+    Ages and priorities are checked against lookup tables of the interned Age
+    and Priority instances, built once from MIN_AGE/MAX_AGE and the installed
+    priorities, so a dirty file costs one dictionary miss per bad field.
+
+    Attributes:
+        _ages (Dict[Union[int, str], Age]): The Age instance of each valid age, keyed by int and by decimal string.
+        _priorities (Dict[str, Priority]): The Priority instance of each valid priority name.
+    """
+    def __init__(self):
+        """Initializes a BatchValidationService instance from the currently installed priorities."""
+        self._ages: Dict[Union[int, str], Age] = {}
+        for age in range(MIN_AGE, MAX_AGE + 1):
+            self._ages[age] = self._ages[str(age)] = Age.of(age)
+        self._priorities: Dict[str, Priority] = {name: Priority.of(name) for name in PRIORITIES_LIST}
+
+    def _age_of(self, patient_age: object) -> Optional[Age]:
+        """Looks an age field up, falling back to int() for the values the table does not hold.
+
+        Ints and decimal strings are answered by the table; anything else, such
+        as a float or a signed string, gets the int() conversion of the
+        scalar validation, so both paths accept the same rows.
+
+        Args:
+            patient_age (object): The age field of a row.
+
+        Returns:
+            Optional[Age]: The Age instance, or None if the age is invalid.
+        """
+        if isinstance(patient_age, (int, str)):
+            age = self._ages.get(patient_age)
+            if age is not None:
+                return age
+        try:
+            return self._ages.get(int(patient_age))
+        except (TypeError, ValueError, OverflowError):
+            return None
+
+    def validate_rows(self, rows: Iterable[Tuple[str, Union[int, str], str]], first_row: int = 1) -> Tuple[List[Tuple[int, MedicalAppointment]], List[RowError]]:
+        """Validates (patient name, patient age, priority) rows.
+
+        Args:
+            rows (Iterable[Tuple[str, Union[int, str], str]]): The rows to be validated.
+            first_row (int): The number of the first row.
+
+        Returns:
+            Tuple[List[Tuple[int, MedicalAppointment]], List[RowError]]: The valid rows as (row number, appointment), in input order, and the errors.
+        """
+        priorities = self._priorities
+        accepted = []
+        errors = []
+        for row, fields in enumerate(rows, first_row):
+            try:
+                patient_name, patient_age, priority = fields
+            except (TypeError, ValueError):
+                errors.append(RowError(row, REASON_MALFORMED))
+                continue
+            age = self._age_of(patient_age)
+            if age is None:
+                errors.append(RowError(row, REASON_INVALID_AGE))
+                continue
+            priority = priorities.get(priority) if isinstance(priority, str) else None
+            if priority is None:
+                errors.append(RowError(row, REASON_INVALID_PRIORITY))
+                continue
+            accepted.append((row, MedicalAppointment(Patient(patient_name, age), priority)))
+        return accepted, errors
+
+    def validate_lines(self, lines: Iterable[str], first_row: int = 1) -> Tuple[List[Tuple[int, MedicalAppointment]], List[RowError]]:
+        """Validates ``Nome, Idade, Prioridade`` lines, skipping blank ones.
+
+        Args:
+            lines (Iterable[str]): The lines to be validated.
+            first_row (int): The number of the first line.
+
+        Returns:
+            Tuple[List[Tuple[int, MedicalAppointment]], List[RowError]]: The valid lines as (line number, appointment), in input order, and the errors.
+        """
+        ages = self._ages
+        priorities = self._priorities
+        accepted = []
+        errors = []
+        for row, line in enumerate(lines, first_row):
+            line = line.strip()
+            if not line:
+                continue
+            fields = line.split(", ")
+            if len(fields) != 3:
+                errors.append(RowError(row, REASON_MALFORMED))
+                continue
+            patient_name, patient_age, priority = fields
+            # "007" is accepted as 7, as int() would do
+            age = ages.get(patient_age.strip().lstrip('0') or '0')
+            if age is None:
+                errors.append(RowError(row, REASON_INVALID_AGE))
+                continue
+            priority = priorities.get(priority.strip())
+            if priority is None:
+                errors.append(RowError(row, REASON_INVALID_PRIORITY))
+                continue
+            accepted.append((row, MedicalAppointment(Patient(patient_name, age), priority)))
+        return accepted, errors
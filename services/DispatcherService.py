@@ -0,0 +1,150 @@
+import heapq
+import time
+from itertools import count
+from typing import Callable, Dict, List, Tuple
+
+from entities.medical.ConsultationRoom import ConsultationRoom
+from entities.medical.MedicalAppointment import MedicalAppointment
+from entities.medical.MedicalManagementSystem import MedicalManagementSystem
+
+class DispatcherService:
+    """Assigns the queue of a medical management system to parallel consultation rooms.
+
+    Each room's restrictions are compiled once into a queue filter, so an
+    assignment is a single filtered pop from the queue engine. Free rooms wait
+    in a heap that offers patients to the most restricted rooms first, which
+    keeps a pediatrics room from being left idle while a general room takes
+    its patients.
+
+    Attributes:
+        _medical_management_system (MedicalManagementSystem): The medical management system being served.
+        _clock (Callable[[], float]): The time source.
+        _started (float): When the dispatcher was created.
+        _rooms (Dict[str, ConsultationRoom]): The rooms by name.
+        _filters (Dict[str, object]): The compiled queue filter of each room.
+        _breadths (Dict[str, int]): The number of sort keys each room accepts.
+        _free (List[Tuple[int, int, str]]): The heap of (number of accepted keys, registration order, name) of the free rooms.
+        _order (count): The registration order generator.
+    """
+    def __init__(self, medical_management_system: MedicalManagementSystem, clock: Callable[[], float] = time.monotonic):
+        """Initializes a DispatcherService instance.
+
+        Args:
+            medical_management_system (MedicalManagementSystem): The medical management system to be served.
+            clock (Callable[[], float]): The time source, time.monotonic by default.
+        """
+        self._medical_management_system: MedicalManagementSystem = medical_management_system
+        self._clock: Callable[[], float] = clock
+        self._started: float = clock()
+        self._rooms: Dict[str, ConsultationRoom] = {}
+        self._filters: Dict[str, object] = {}
+        self._breadths: Dict[str, int] = {}
+        self._free: List[Tuple[int, int, str]] = []
+        self._order: count = count()
+
+    @property
+    def medical_management_system(self) -> MedicalManagementSystem:
+        """Gets the medical management system instance.
+
+        Returns:
+            MedicalManagementSystem: The medical management system.
+        """
+        return self._medical_management_system
+
+    @property
+    def rooms(self) -> Dict[str, ConsultationRoom]:
+        """Gets the rooms by name.
+
+        Returns:
+            Dict[str, ConsultationRoom]: A copy of the rooms mapping.
+        """
+        return dict(self._rooms)
+
+    def add_room(self, room: ConsultationRoom):
+        """Registers a free consultation room.
+
+        Args:
+            room (ConsultationRoom): The room to be added.
+
+        Raises:
+            ValueError: If a room with the same name already exists.
+        """
+        if room.name in self._rooms:
+            raise ValueError("A sala já existe")
+        sort_keys = set(room.sort_keys())
+        self._rooms[room.name] = room
+        self._filters[room.name] = self.medical_management_system.compile_filter(sort_keys)
+        self._breadths[room.name] = len(sort_keys)
+        heapq.heappush(self._free, (len(sort_keys), next(self._order), room.name))
+
+    def assign(self) -> List[Tuple[ConsultationRoom, MedicalAppointment]]:
+        """Fills the free rooms with the next appointments they serve.
+
+        Returns:
+            List[Tuple[ConsultationRoom, MedicalAppointment]]: The assignments made, most restricted rooms first.
+        """
+        medical_management_system = self.medical_management_system
+        now = self._clock()
+        assignments = []
+        idle = []
+        while self._free and len(medical_management_system):
+            slot = heapq.heappop(self._free)
+            room = self._rooms[slot[-1]]
+            medical_appointment = medical_management_system.pop_next_matching(self._filters[room.name])
+            if medical_appointment is None:
+                idle.append(slot)
+                continue
+            room.start(medical_appointment, now)
+            assignments.append((room, medical_appointment))
+        for slot in idle:
+            heapq.heappush(self._free, slot)
+        return assignments
+
+    def release(self, room_name: str) -> MedicalAppointment:
+        """Finishes the appointment of a room and frees it.
+
+        Args:
+            room_name (str): The name of the room.
+
+        Returns:
+            MedicalAppointment: The finished appointment.
+
+        Raises:
+            KeyError: If the room does not exist.
+            ValueError: If the room is already free.
+        """
+        room = self._rooms[room_name]
+        medical_appointment = room.finish(self._clock())
+        heapq.heappush(self._free, (self._breadths[room_name], next(self._order), room_name))
+        return medical_appointment
+
+    def stats(self) -> Dict[str, object]:
+        """Reports the utilisation and throughput of the rooms since the dispatcher was created.
+
+        Utilisation is the fraction of the elapsed time spent on appointments
+        and throughput the number of finished appointments per clock unit.
+
+        Returns:
+            Dict[str, object]: The elapsed time, the busy and free room counts, the totals and the figures of each room.
+        """
+        now = self._clock()
+        elapsed = now - self._started
+        rooms = {}
+        for name, room in self._rooms.items():
+            rooms[name] = {
+                'busy': room.busy,
+                'served': room.served,
+                'utilisation': room.busy_time(now) / elapsed if elapsed > 0 else 0.0,
+                'throughput': room.served / elapsed if elapsed > 0 else 0.0,
+            }
+        served = sum(room.served for room in self._rooms.values())
+        busy = sum(room.busy for room in self._rooms.values())
+        return {
+            'elapsed': elapsed,
+            'busy_rooms': busy,
+            'free_rooms': len(self._rooms) - busy,
+            'served': served,
+            'utilisation': sum(figures['utilisation'] for figures in rooms.values()) / len(rooms) if rooms else 0.0,
+            'throughput': served / elapsed if elapsed > 0 else 0.0,
+            'rooms': rooms,
+        }
@@ -1,14 +1,22 @@
+from typing import Iterable, List, Tuple
+
 from entities.medical.MedicalAppointment import MedicalAppointment
 from entities.medical.MedicalManagementSystem import MedicalManagementSystem
 from entities.patients.Age import Age
 from entities.patients.Patient import Patient
 from entities.patients.Priority import Priority
+from services.BatchValidationService import BatchValidationService, RowError
+
+APPOINTMENT_ACCEPTED = 'accepted'
+APPOINTMENT_DUPLICATE = 'duplicate'
+APPOINTMENT_INVALID = 'invalid'
 
 class MedicalManagementSystemService:
     """Manages services for scheduling medical appointments within a medical management system.
 
     Attributes:
         _medical_management_system (MedicalManagementSystem): The medical management system instance.
+        _batch_validation_service (BatchValidationService): The validator of bulk rows, built from the priorities installed at creation.
     """
     def __init__(self, medical_management_system: MedicalManagementSystem):
         """Initializes a MedicalManagementSystemService instance.
@@ -17,6 +25,7 @@ class MedicalManagementSystemService:
             medical_management_system (MedicalManagementSystem): The medical management system to be used.
         """
         self._medical_management_system: MedicalManagementSystem = None
+        self._batch_validation_service: BatchValidationService = BatchValidationService()
 
         self.medical_management_system = medical_management_system
 
@@ -49,8 +58,55 @@ class MedicalManagementSystemService:
         Returns:
             bool: True if the appointment was successfully added, False if it already exists.
         """
-        age: Age = Age(patient_age)
-        priority: Priority = Priority(priority)
+        age: Age = Age.of(patient_age)
+        priority: Priority = Priority.of(priority)
+        patient: Patient = Patient(patient_name, age)
+        medical_appointment: MedicalAppointment = MedicalAppointment(patient, priority)
+        return self.medical_management_system.add_appointment(medical_appointment) is not None
+
+    def cancel_an_appointment(self, patient_name: str, patient_age: int, priority: str) -> bool:
+        """Cancels a scheduled medical appointment.
+
+        Args:
+            patient_name (str): The name of the patient.
+            patient_age (int): The age of the patient.
+            priority (str): The priority level of the appointment.
+
+        Returns:
+            bool: True if the appointment was cancelled, False if it is not scheduled.
+        """
+        age: Age = Age.of(patient_age)
+        priority: Priority = Priority.of(priority)
         patient: Patient = Patient(patient_name, age)
         medical_appointment: MedicalAppointment = MedicalAppointment(patient, priority)
-        return self.medical_management_system.add_appointment(medical_appointment)
\ No newline at end of file
+        return self.medical_management_system.cancel_appointment(medical_appointment)
+
+    def make_appointments_bulk(self, rows: Iterable[Tuple[str, int, str]]) -> List[str]:
+        """Creates and schedules a batch of medical appointments with a single merge into the queue.
+
+        Args:
+            rows (Iterable[Tuple[str, int, str]]): The (patient name, patient age, priority) rows to be scheduled.
+
+        Returns:
+            List[str]: For each row, APPOINTMENT_ACCEPTED, APPOINTMENT_DUPLICATE or APPOINTMENT_INVALID.
+        """
+        rows = list(rows)
+        accepted, _ = self._batch_validation_service.validate_rows(rows, 0)
+        results: List[str] = [APPOINTMENT_INVALID] * len(rows)
+        handles = self.medical_management_system.add_appointments([medical_appointment for _, medical_appointment in accepted])
+        for (position, _), handle in zip(accepted, handles):
+            results[position] = APPOINTMENT_DUPLICATE if handle is None else APPOINTMENT_ACCEPTED
+        return results
+
+    def make_appointments_from_lines(self, lines: Iterable[str]) -> List[RowError]:
+        """Schedules every valid ``Nome, Idade, Prioridade`` line and reports the rejected ones.
+
+        Args:
+            lines (Iterable[str]): The input lines, e.g. an open partner file.
+
+        Returns:
+            List[RowError]: The invalid lines with their 1-based number and reason, in input order.
+        """
+        accepted, errors = self._batch_validation_service.validate_lines(lines)
+        self.medical_management_system.add_appointments([medical_appointment for _, medical_appointment in accepted])
+        return errors
\ No newline at end of file
@@ -0,0 +1,108 @@
+from typing import Iterable, Iterator, Tuple
+
+from services.MedicalManagementSystemService import MedicalManagementSystemService
+
+COMMAND_ARRIVAL = 'arrival'
+COMMAND_NEXT = 'next'
+COMMAND_CANCEL = 'cancel'
+COMMAND_INVALID = 'invalid'
+
+class MedicalStreamService:
+    """Runs a medical management system as an online stream of commands.
+
+    Each input line is one of:
+        ``Nome, Idade, Prioridade`` to schedule an arrival,
+        ``next`` to dispatch the next patient,
+        ``cancel Nome, Idade, Prioridade`` to cancel a scheduled appointment.
+
+    Lines are consumed lazily and every response is produced as soon as its
+    command is handled, so memory only depends on the size of the queue.
+
+    Attributes:
+        _medical_management_system_service (MedicalManagementSystemService): The service that schedules the appointments.
+    """
+    def __init__(self, medical_management_system_service: MedicalManagementSystemService):
+        """Initializes a MedicalStreamService instance.
+
+        Args:
+            medical_management_system_service (MedicalManagementSystemService): The service to be used.
+        """
+        self._medical_management_system_service: MedicalManagementSystemService = None
+
+        self.medical_management_system_service = medical_management_system_service
+
+    @property
+    def medical_management_system_service(self) -> MedicalManagementSystemService:
+        """Gets the medical management system service.
+
+        Returns:
+            MedicalManagementSystemService: The service that schedules the appointments.
+        """
+        return self._medical_management_system_service
+
+    @medical_management_system_service.setter
+    def medical_management_system_service(self, medical_management_system_service: MedicalManagementSystemService):
+        """Sets the medical management system service.
+
+        Args:
+            medical_management_system_service (MedicalManagementSystemService): The service to be set.
+        """
+        self._medical_management_system_service = medical_management_system_service
+
+    def parse_commands(self, lines: Iterable[str]) -> Iterator[Tuple[str, str, tuple]]:
+        """Turns raw input lines into commands, skipping blank lines.
+
+        Args:
+            lines (Iterable[str]): The raw input lines.
+
+        Returns:
+            Iterator[Tuple[str, str, tuple]]: The (command, line, arguments) triples.
+        """
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+            if line == COMMAND_NEXT:
+                yield COMMAND_NEXT, line, ()
+                continue
+            command = COMMAND_ARRIVAL
+            fields = line
+            if line.startswith(COMMAND_CANCEL + " "):
+                command = COMMAND_CANCEL
+                fields = line[len(COMMAND_CANCEL) + 1:]
+            fields = fields.split(", ")
+            if len(fields) != 3 or not fields[1].strip().isdigit():
+                yield COMMAND_INVALID, line, ()
+                continue
+            yield command, line, (fields[0], int(fields[1]), fields[2])
+
+    def process(self, lines: Iterable[str]) -> Iterator[str]:
+        """Executes the commands read from the input lines.
+
+        Args:
+            lines (Iterable[str]): The raw input lines, e.g. sys.stdin.
+
+        Returns:
+            Iterator[str]: The response of each command that produces output.
+        """
+        service = self.medical_management_system_service
+        medical_management_system = service.medical_management_system
+        for command, line, arguments in self.parse_commands(lines):
+            if command == COMMAND_NEXT:
+                medical_appointment = medical_management_system.pop_next()
+                if medical_appointment is None:
+                    yield "Fila vazia"
+                else:
+                    yield f"Atendimento: {medical_appointment.patient.name}"
+                continue
+            if command == COMMAND_INVALID:
+                yield f"Entrada inválida: {line}"
+                continue
+            try:
+                if command == COMMAND_ARRIVAL:
+                    if not service.make_an_appointment(*arguments):
+                        yield f"Agendamento duplicado: {arguments[0]}"
+                elif not service.cancel_an_appointment(*arguments):
+                    yield f"Agendamento não encontrado: {arguments[0]}"
+            except ValueError as error:
+                yield f"Entrada inválida: {line} ({error})"
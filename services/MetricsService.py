@@ -0,0 +1,244 @@
+import json
+import os
+import threading
+import time
+from typing import Callable, Dict, List
+
+from services.MedicalManagementSystemService import APPOINTMENT_INVALID
+
+OPERATION_ADD = 'add'
+OPERATION_ADD_BULK = 'add_bulk'
+OPERATION_DISPATCH = 'dispatch'
+OPERATION_CANCEL = 'cancel'
+OPERATION_REPRIORITIZE = 'reprioritize'
+OPERATION_ORDER = 'order'
+OPERATION_RENDER = 'render'
+OPERATION_MAKE_AN_APPOINTMENT = 'make_an_appointment'
+OPERATION_MAKE_APPOINTMENTS_BULK = 'make_appointments_bulk'
+OPERATION_MAKE_APPOINTMENTS_FROM_LINES = 'make_appointments_from_lines'
+OPERATION_CANCEL_AN_APPOINTMENT = 'cancel_an_appointment'
+COUNTER_DUPLICATE = 'duplicate'
+COUNTER_VALIDATION_FAILURE = 'validation_failure'
+# instrumented method -> operation whose latency it records
+INSTRUMENTED_METHODS = {
+    'add_appointment': OPERATION_ADD,
+    'add_appointments': OPERATION_ADD_BULK,
+    'pop_next': OPERATION_DISPATCH,
+    'pop_next_matching': OPERATION_DISPATCH,
+    'cancel_appointment': OPERATION_CANCEL,
+    'reprioritize': OPERATION_REPRIORITIZE,
+    'order_appointments': OPERATION_ORDER,
+    '_compute_order': OPERATION_ORDER,
+    '__str__': OPERATION_RENDER,
+    'write_order': OPERATION_RENDER,
+    'make_an_appointment': OPERATION_MAKE_AN_APPOINTMENT,
+    'make_appointments_bulk': OPERATION_MAKE_APPOINTMENTS_BULK,
+    'make_appointments_from_lines': OPERATION_MAKE_APPOINTMENTS_FROM_LINES,
+    'cancel_an_appointment': OPERATION_CANCEL_AN_APPOINTMENT,
+}
+PERCENTILES = [50, 90, 99]
+
+class MetricsService:
+    """Optional operation counters and latency histograms.
+
+    attach() swaps the class of a MedicalManagementSystem or of a
+    MedicalManagementSystemService for a generated subclass that times the
+    methods of INSTRUMENTED_METHODS, so objects that are not attached run the
+    original code with no extra cost at all. Latencies go to power-of-two
+    microsecond buckets. Duplicates are counted by an attached system and
+    validation failures (the Age/Priority ValueErrors and the rejected bulk
+    rows) by an attached service.
+
+    Attributes:
+        _lock (threading.Lock): The lock guarding the counters and histograms.
+        _histograms (Dict[str, List[int]]): The latency histogram of each operation, bucket i holding latencies below 2**i µs.
+        _totals (Dict[str, float]): The total seconds of each operation.
+        _maximums (Dict[str, float]): The slowest call of each operation, in seconds.
+        _counters (Dict[str, int]): The event counters.
+        _subclasses (Dict[type, type]): The instrumented subclass generated for each class.
+        _dump_stop (threading.Event): The event stopping the periodic dump, None when it is not running.
+    """
+    def __init__(self):
+        """Initializes an empty MetricsService instance."""
+        self._lock: threading.Lock = threading.Lock()
+        self._histograms: Dict[str, List[int]] = {}
+        self._totals: Dict[str, float] = {}
+        self._maximums: Dict[str, float] = {}
+        self._counters: Dict[str, int] = {}
+        self._subclasses: Dict[type, type] = {}
+        self._dump_stop: threading.Event = None
+
+    def observe(self, operation: str, seconds: float):
+        """Records the latency of one call.
+
+        Args:
+            operation (str): The operation name.
+            seconds (float): The latency of the call.
+        """
+        bucket = int(seconds * 1e6).bit_length()
+        with self._lock:
+            histogram = self._histograms.get(operation)
+            if histogram is None:
+                histogram = self._histograms[operation] = []
+                self._totals[operation] = 0.0
+                self._maximums[operation] = 0.0
+            if bucket >= len(histogram):
+                histogram.extend([0] * (bucket + 1 - len(histogram)))
+            histogram[bucket] += 1
+            self._totals[operation] += seconds
+            if seconds > self._maximums[operation]:
+                self._maximums[operation] = seconds
+
+    def increment(self, counter: str, amount: int = 1):
+        """Increments an event counter.
+
+        Args:
+            counter (str): The counter name.
+            amount (int): The amount to be added.
+        """
+        with self._lock:
+            self._counters[counter] = self._counters.get(counter, 0) + amount
+
+    def stats(self) -> dict:
+        """Takes a snapshot of every counter and latency histogram.
+
+        Returns:
+            dict: The counters, and for each operation its count, total, mean, maximum and approximate percentiles in seconds plus the histogram keyed by the bucket upper bound in µs.
+        """
+        with self._lock:
+            histograms = {operation: list(histogram) for operation, histogram in self._histograms.items()}
+            totals = dict(self._totals)
+            maximums = dict(self._maximums)
+            counters = dict(self._counters)
+        operations = {}
+        for operation, histogram in histograms.items():
+            calls = sum(histogram)
+            summary = {
+                'count': calls,
+                'total_seconds': totals[operation],
+                'mean_seconds': totals[operation] / calls,
+                'max_seconds': maximums[operation],
+                'histogram_us': {str(2 ** bucket): amount for bucket, amount in enumerate(histogram) if amount},
+            }
+            for percentile in PERCENTILES:
+                threshold = calls * percentile / 100
+                seen = 0
+                for bucket, amount in enumerate(histogram):
+                    seen += amount
+                    if seen >= threshold:
+                        summary[f'p{percentile}_seconds'] = min(2 ** bucket / 1e6, maximums[operation])
+                        break
+            operations[operation] = summary
+        return {'counters': counters, 'operations': operations}
+
+    def reset(self):
+        """Clears every counter and histogram."""
+        with self._lock:
+            self._histograms.clear()
+            self._totals.clear()
+            self._maximums.clear()
+            self._counters.clear()
+
+    def _timed(self, operation: str, method: Callable) -> Callable:
+        """Wraps a method so every call records its latency and events.
+
+        Args:
+            operation (str): The operation name.
+            method (Callable): The original method.
+
+        Returns:
+            Callable: The instrumented method.
+        """
+        metrics = self
+
+        def instrumented(instance, *args, **kwargs):
+            start = time.perf_counter()
+            try:
+                result = method(instance, *args, **kwargs)
+            except ValueError:
+                if operation == OPERATION_MAKE_AN_APPOINTMENT:
+                    metrics.increment(COUNTER_VALIDATION_FAILURE)
+                raise
+            finally:
+                metrics.observe(operation, time.perf_counter() - start)
+            if operation == OPERATION_ADD and result is None:
+                metrics.increment(COUNTER_DUPLICATE)
+            elif operation == OPERATION_ADD_BULK:
+                metrics.increment(COUNTER_DUPLICATE, result.count(None))
+            elif operation == OPERATION_MAKE_APPOINTMENTS_BULK:
+                metrics.increment(COUNTER_VALIDATION_FAILURE, result.count(APPOINTMENT_INVALID))
+            elif operation == OPERATION_MAKE_APPOINTMENTS_FROM_LINES:
+                metrics.increment(COUNTER_VALIDATION_FAILURE, len(result))
+            return result
+
+        instrumented.__name__ = method.__name__
+        instrumented.__doc__ = method.__doc__
+        return instrumented
+
+    def attach(self, instance: object) -> object:
+        """Starts recording the operations of a system or service.
+
+        Args:
+            instance (object): A MedicalManagementSystem or MedicalManagementSystemService (or subclass) instance.
+
+        Returns:
+            object: The same instance, now instrumented.
+        """
+        cls = type(instance)
+        if getattr(cls, '_metrics_service', None) is self:
+            return instance
+        subclass = self._subclasses.get(cls)
+        if subclass is None:
+            namespace = {'_metrics_service': self, '_instrumented_class': cls}
+            for name, operation in INSTRUMENTED_METHODS.items():
+                if any(name in vars(klass) for klass in cls.__mro__ if klass is not object):
+                    namespace[name] = self._timed(operation, getattr(cls, name))
+            subclass = self._subclasses[cls] = type(f"Instrumented{cls.__name__}", (cls,), namespace)
+        instance.__class__ = subclass
+        return instance
+
+    def detach(self, instance: object) -> object:
+        """Stops recording the operations of a system or service.
+
+        Args:
+            instance (object): An instance passed to attach().
+
+        Returns:
+            object: The same instance, back to its original class.
+        """
+        if getattr(type(instance), '_metrics_service', None) is self:
+            instance.__class__ = type(instance)._instrumented_class
+        return instance
+
+    def dump(self, path: str):
+        """Writes the current stats to a JSON file, replacing it atomically.
+
+        Args:
+            path (str): The path of the JSON file.
+        """
+        temporary_path = path + '.tmp'
+        with open(temporary_path, 'w', encoding='utf-8') as file:
+            json.dump(self.stats(), file, indent=2)
+        os.replace(temporary_path, path)
+
+    def start_dump(self, path: str, interval: float):
+        """Dumps the stats to a file every interval seconds from a daemon thread.
+
+        Args:
+            path (str): The path of the JSON file.
+            interval (float): The seconds between dumps.
+        """
+        self.stop_dump()
+        stop = self._dump_stop = threading.Event()
+
+        def run():
+            while not stop.wait(interval):
+                self.dump(path)
+
+        threading.Thread(target=run, name='metrics-dump', daemon=True).start()
+
+    def stop_dump(self):
+        """Stops the periodic dump, if it is running."""
+        if self._dump_stop is not None:
+            self._dump_stop.set()
+            self._dump_stop = None
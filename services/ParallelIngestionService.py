@@ -0,0 +1,123 @@
+import heapq
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+from entities.medical.MedicalAppointment import MedicalAppointment
+from entities.medical.MedicalManagementSystem import MedicalManagementSystem
+from entities.patients.Age import Age
+from entities.patients.Patient import Patient
+from entities.patients.Priority import Priority
+from entities.patients.PriorityScheme import PriorityScheme
+from services.BatchValidationService import BatchValidationService
+from services.MedicalManagementSystemService import APPOINTMENT_ACCEPTED, APPOINTMENT_DUPLICATE, APPOINTMENT_INVALID
+
+DEFAULT_CHUNK_SIZE = 50000
+DEFAULT_MERGE_BATCH_SIZE = 10000
+
+def sort_chunk(chunk: Tuple[int, List[str]]) -> Tuple[List[tuple], int]:
+    """Parses, validates and sorts one chunk of ``Nome, Idade, Prioridade`` lines into a run.
+
+    Runs in a worker process, so it only returns plain tuples.
+
+    Args:
+        chunk (Tuple[int, List[str]]): The number of the first line and the lines of the chunk.
+
+    Returns:
+        Tuple[List[tuple], int]: The (-sort key, line number, name, age, priority) rows in attendance order, and the number of invalid lines.
+    """
+    first_line, lines = chunk
+    accepted, errors = BatchValidationService().validate_lines(lines, first_line)
+    run = [
+        (-medical_appointment.sort_key, line_number, medical_appointment.patient.name, medical_appointment.patient.age.age, medical_appointment.priority.name)
+        for line_number, medical_appointment in accepted
+    ]
+    run.sort()
+    return run, len(errors)
+
+class ParallelIngestionService:
+    """Ingests large ``Nome, Idade, Prioridade`` files with a pool of worker processes.
+
+    The input is split into chunks that workers parse, validate and sort into
+    runs. The main process then merges the runs with a streaming k-way merge
+    and feeds them to the medical management system in batches, where the
+    global duplicate check happens. Merging in (key, line number) order keeps
+    the arrival tiebreak of the whole file.
+
+    Attributes:
+        _medical_management_system (MedicalManagementSystem): The medical management system to be filled.
+        _workers (int): The number of worker processes, None for one per CPU.
+        _chunk_size (int): The number of lines per chunk.
+    """
+    def __init__(self, medical_management_system: MedicalManagementSystem, workers: int = None, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """Initializes a ParallelIngestionService instance.
+
+        Args:
+            medical_management_system (MedicalManagementSystem): The medical management system to be filled.
+            workers (int): The number of worker processes, None for one per CPU.
+            chunk_size (int): The number of lines per chunk.
+        """
+        self._medical_management_system: MedicalManagementSystem = medical_management_system
+        self._workers: int = workers
+        self._chunk_size: int = chunk_size
+
+    @property
+    def medical_management_system(self) -> MedicalManagementSystem:
+        """Gets the medical management system instance.
+
+        Returns:
+            MedicalManagementSystem: The medical management system.
+        """
+        return self._medical_management_system
+
+    def _chunks(self, lines: Iterable[str]) -> Iterator[Tuple[int, List[str]]]:
+        """Splits the input into numbered chunks.
+
+        Args:
+            lines (Iterable[str]): The input lines.
+
+        Returns:
+            Iterator[Tuple[int, List[str]]]: The number of the first line and the lines of each chunk.
+        """
+        lines = iter(lines)
+        first_line = 1
+        chunk = list(islice(lines, self._chunk_size))
+        while chunk:
+            yield first_line, chunk
+            first_line += len(chunk)
+            chunk = list(islice(lines, self._chunk_size))
+
+    def ingest(self, lines: Iterable[str]) -> Dict[str, int]:
+        """Schedules every appointment of the input.
+
+        Args:
+            lines (Iterable[str]): The input lines, e.g. an open file.
+
+        Returns:
+            Dict[str, int]: The number of accepted, duplicate and invalid lines.
+        """
+        # Workers started without fork would fall back to the default priorities
+        with ProcessPoolExecutor(max_workers=self._workers, initializer=PriorityScheme.install, initargs=(PriorityScheme.current(),)) as executor:
+            results = list(executor.map(sort_chunk, self._chunks(lines)))
+        counts = {APPOINTMENT_ACCEPTED: 0, APPOINTMENT_DUPLICATE: 0, APPOINTMENT_INVALID: sum(invalid for _, invalid in results)}
+        merged = heapq.merge(*(run for run, _ in results))
+        batch = self._next_batch(merged)
+        while batch:
+            for handle in self.medical_management_system.add_appointments(batch):
+                counts[APPOINTMENT_DUPLICATE if handle is None else APPOINTMENT_ACCEPTED] += 1
+            batch = self._next_batch(merged)
+        return counts
+
+    def _next_batch(self, merged: Iterator[tuple]) -> List[MedicalAppointment]:
+        """Builds the appointments of the next merged rows.
+
+        Args:
+            merged (Iterator[tuple]): The merged runs.
+
+        Returns:
+            List[MedicalAppointment]: The appointments in attendance order, empty when the runs are exhausted.
+        """
+        return [
+            MedicalAppointment(Patient(name, Age.of(age)), Priority.of(priority))
+            for _, _, name, age, priority in islice(merged, DEFAULT_MERGE_BATCH_SIZE)
+        ]
@@ -0,0 +1,183 @@
+import argparse
+import heapq
+import json
+import time
+import tracemalloc
+from typing import Dict, List
+
+from entities.medical.AgingPolicy import AgingPolicy
+from entities.medical.ConsultationRoom import ConsultationRoom
+from entities.medical.MedicalManagementSystem import DEFAULT_QUEUE_ENGINE, QUEUE_ENGINES, MedicalManagementSystem
+from services.DispatcherService import DispatcherService
+from services.MedicalManagementSystemService import MedicalManagementSystemService
+from services.MetricsService import MetricsService
+from simulation.WorkloadGenerator import DEFAULT_SEED, EVENT_ARRIVAL, HOURS_PER_DAY, SECONDS_PER_HOUR, WorkloadGenerator
+
+DEFAULT_ROOMS = 10
+PEDIATRIC_MAX_AGE = 17
+PERCENTILES = [50, 90, 99]
+
+class LoadSimulator:
+    """Discrete-event simulation of a synthetic workload against the scheduling stack.
+
+    Arrivals and cancellations come from a WorkloadGenerator and go through a
+    MedicalManagementSystemService; a DispatcherService assigns the queue to
+    the consultation rooms, whose consultations end after the generated
+    service times. Simulated time jumps from one event to the next, so a day
+    runs in seconds. The simulated clock also drives the dispatcher and the
+    optional aging policy, while a MetricsService times every real operation.
+
+    Attributes:
+        _workload_generator (WorkloadGenerator): The source of the events.
+        _rooms (List[ConsultationRoom]): The consultation rooms.
+        _engine (str): The queue engine.
+        _aging_interval (float): The aging promotion interval in simulated seconds, None to disable aging.
+        _memory (bool): Whether peak memory is traced.
+        _now (float): The current simulated time, in seconds.
+    """
+    def __init__(self, workload_generator: WorkloadGenerator, rooms: List[ConsultationRoom], engine: str = DEFAULT_QUEUE_ENGINE, aging_interval: float = None, memory: bool = False):
+        """Initializes a LoadSimulator instance.
+
+        Args:
+            workload_generator (WorkloadGenerator): The source of the events.
+            rooms (List[ConsultationRoom]): The consultation rooms, all free.
+            engine (str): The queue engine, 'heap' (default) or 'bucket'.
+            aging_interval (float): The aging promotion interval in simulated seconds, None to disable aging.
+            memory (bool): Whether peak memory is traced, which slows the run down.
+        """
+        self._workload_generator: WorkloadGenerator = workload_generator
+        self._rooms: List[ConsultationRoom] = rooms
+        self._engine: str = engine
+        self._aging_interval: float = aging_interval
+        self._memory: bool = memory
+        self._now: float = 0.0
+
+    def _clock(self) -> float:
+        """Gets the current simulated time.
+
+        Returns:
+            float: The simulated time, in seconds.
+        """
+        return self._now
+
+    def run(self, duration: float) -> dict:
+        """Simulates a period and reports what happened.
+
+        Args:
+            duration (float): The length of the period, in simulated seconds.
+
+        Returns:
+            dict: The JSON-serializable report with event counts, queue length, waiting times, room figures, operation latencies, speed and peak memory.
+        """
+        self._now = 0.0
+        medical_management_system = MedicalManagementSystem('Simulação', self._engine)
+        if self._aging_interval is not None:
+            medical_management_system.enable_aging(AgingPolicy(self._aging_interval, clock=self._clock))
+        medical_management_system_service = MedicalManagementSystemService(medical_management_system)
+        metrics_service = MetricsService()
+        metrics_service.attach(medical_management_system)
+        metrics_service.attach(medical_management_system_service)
+        dispatcher_service = DispatcherService(medical_management_system, clock=self._clock)
+        for room in self._rooms:
+            dispatcher_service.add_room(room)
+
+        arrivals: Dict[str, float] = {}
+        service_times: Dict[str, float] = {}
+        completions = []
+        waits = []
+        counts = {'events': 0, 'arrivals': 0, 'duplicates': 0, 'cancelled': 0, 'cancel_missed': 0, 'served': 0}
+        queue_area = 0.0
+        queue_peak = 0
+        last_time = 0.0
+
+        def dispatch():
+            for room, medical_appointment in dispatcher_service.assign():
+                name = medical_appointment.patient.name
+                waits.append(self._now - arrivals.pop(name))
+                heapq.heappush(completions, (self._now + service_times.pop(name), room.name))
+
+        if self._memory:
+            tracemalloc.start()
+        started = time.perf_counter()
+        events = self._workload_generator.events(duration)
+        event = next(events, None)
+        while event is not None or completions:
+            completing = completions and (event is None or completions[0][0] <= event.time)
+            self._now = completions[0][0] if completing else event.time
+            queue_area += len(medical_management_system) * (self._now - last_time)
+            last_time = self._now
+            counts['events'] += 1
+            if completing:
+                dispatcher_service.release(heapq.heappop(completions)[1])
+                counts['served'] += 1
+            elif event.kind == EVENT_ARRIVAL:
+                counts['arrivals'] += 1
+                if medical_management_system_service.make_an_appointment(event.name, event.age, event.priority):
+                    arrivals[event.name] = self._now
+                    service_times[event.name] = event.service_time
+                else:
+                    counts['duplicates'] += 1
+                event = next(events, None)
+            else:
+                if medical_management_system_service.cancel_an_appointment(event.name, event.age, event.priority):
+                    counts['cancelled'] += 1
+                    del arrivals[event.name]
+                    del service_times[event.name]
+                else:
+                    counts['cancel_missed'] += 1
+                event = next(events, None)
+            dispatch()
+            queue_peak = max(queue_peak, len(medical_management_system))
+        wall_seconds = time.perf_counter() - started
+        peak_bytes = None
+        if self._memory:
+            peak_bytes = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+        waits.sort()
+        return {
+            'engine': self._engine,
+            'simulated_seconds': self._now,
+            'wall_seconds': wall_seconds,
+            'speedup': self._now / wall_seconds if wall_seconds else None,
+            'events_per_second': counts['events'] / wall_seconds if wall_seconds else None,
+            'counts': counts,
+            'queue_length': {
+                'mean': queue_area / self._now if self._now else 0.0,
+                'max': queue_peak,
+            },
+            'waiting_seconds': {
+                'mean': sum(waits) / len(waits) if waits else 0.0,
+                'max': waits[-1] if waits else 0.0,
+                **{f"p{percentile}": waits[min(len(waits) - 1, len(waits) * percentile // 100)] if waits else 0.0 for percentile in PERCENTILES},
+            },
+            'rooms': dispatcher_service.stats(),
+            'operations': metrics_service.stats(),
+            'peak_bytes': peak_bytes,
+        }
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Simulação de eventos discretos de um dia de atendimento")
+    parser.add_argument('--hours', type=float, default=HOURS_PER_DAY, help="duração simulada em horas")
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED)
+    parser.add_argument('--rooms', type=int, default=DEFAULT_ROOMS, help="consultórios gerais")
+    parser.add_argument('--pediatric-rooms', type=int, default=0, help=f"consultórios de pediatria (até {PEDIATRIC_MAX_AGE} anos)")
+    parser.add_argument('--engine', choices=list(QUEUE_ENGINES), default=DEFAULT_QUEUE_ENGINE)
+    parser.add_argument('--aging-interval', type=float, help="intervalo de promoção por espera, em segundos simulados")
+    parser.add_argument('--memory', action='store_true', help="mede o pico de memória (mais lento)")
+    parser.add_argument('--output', help="arquivo JSON do relatório completo")
+    arguments = parser.parse_args()
+
+    rooms = [ConsultationRoom(f"Consultório {index + 1}") for index in range(arguments.rooms)]
+    rooms += [ConsultationRoom(f"Pediatria {index + 1}", max_age=PEDIATRIC_MAX_AGE) for index in range(arguments.pediatric_rooms)]
+    simulator = LoadSimulator(WorkloadGenerator(arguments.seed), rooms, arguments.engine, arguments.aging_interval, arguments.memory)
+    report = simulator.run(arguments.hours * SECONDS_PER_HOUR)
+    print(f"eventos: {report['counts']['events']} em {report['wall_seconds']:.2f} s ({report['speedup']:.0f}x o tempo real)")
+    print(f"fila: média {report['queue_length']['mean']:.1f}, máximo {report['queue_length']['max']}")
+    print(f"espera: média {report['waiting_seconds']['mean'] / 60:.1f} min, p90 {report['waiting_seconds']['p90'] / 60:.1f} min")
+    print(f"consultórios: utilização {report['rooms']['utilisation']:.1%}, {report['counts']['served']} atendimentos")
+    if report['peak_bytes'] is not None:
+        print(f"memória: pico de {report['peak_bytes'] / 2 ** 20:.1f} MiB")
+    if arguments.output:
+        with open(arguments.output, 'w', encoding='utf-8') as file:
+            json.dump(report, file, indent=2)
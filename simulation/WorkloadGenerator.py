@@ -0,0 +1,279 @@
+import argparse
+import heapq
+import random
+import sys
+from typing import Dict, Iterator, List, Tuple
+
+from entities.patients.Age import MAX_AGE, MIN_AGE
+from entities.patients.Priority import PRIORITIES_LIST
+from services.MedicalManagementSystemService import MedicalManagementSystemService
+
+EVENT_ARRIVAL = 'arrival'
+EVENT_CANCEL = 'cancel'
+SECONDS_PER_HOUR = 3600
+HOURS_PER_DAY = 24
+DEFAULT_SEED = 42
+# (hora do dia, chegadas por hora): madrugada calma, picos de manhã e à tarde
+DEFAULT_RATES = [(0, 6), (7, 40), (10, 60), (13, 35), (16, 50), (20, 20)]
+DEFAULT_AGE_MIX = [(MIN_AGE, 17, 0.2), (18, 64, 0.55), (65, MAX_AGE, 0.25)]
+DEFAULT_CANCEL_PROBABILITY = 0.05
+DEFAULT_MEAN_CANCEL_DELAY = 1800.0
+DEFAULT_MEAN_SERVICE_TIME = 900.0
+
+class WorkloadEvent:
+    """Represents one event of a synthetic workload.
+
+    Attributes:
+        _time (float): When the event happens, in seconds from the start.
+        _kind (str): EVENT_ARRIVAL or EVENT_CANCEL.
+        _name (str): The patient name.
+        _age (int): The patient age.
+        _priority (str): The priority name.
+        _service_time (float): The consultation length in seconds, for arrivals.
+    """
+    __slots__ = ('_time', '_kind', '_name', '_age', '_priority', '_service_time')
+
+    def __init__(self, time: float, kind: str, name: str, age: int, priority: str, service_time: float = None):
+        """Initializes a WorkloadEvent instance.
+
+        Args:
+            time (float): When the event happens, in seconds from the start.
+            kind (str): EVENT_ARRIVAL or EVENT_CANCEL.
+            name (str): The patient name.
+            age (int): The patient age.
+            priority (str): The priority name.
+            service_time (float): The consultation length in seconds, for arrivals.
+        """
+        self._time: float = time
+        self._kind: str = kind
+        self._name: str = name
+        self._age: int = age
+        self._priority: str = priority
+        self._service_time: float = service_time
+
+    @property
+    def time(self) -> float:
+        """Gets when the event happens.
+
+        Returns:
+            float: The time in seconds from the start.
+        """
+        return self._time
+
+    @property
+    def kind(self) -> str:
+        """Gets the kind of the event.
+
+        Returns:
+            str: EVENT_ARRIVAL or EVENT_CANCEL.
+        """
+        return self._kind
+
+    @property
+    def name(self) -> str:
+        """Gets the patient name.
+
+        Returns:
+            str: The patient name.
+        """
+        return self._name
+
+    @property
+    def age(self) -> int:
+        """Gets the patient age.
+
+        Returns:
+            int: The patient age.
+        """
+        return self._age
+
+    @property
+    def priority(self) -> str:
+        """Gets the priority name.
+
+        Returns:
+            str: The priority name.
+        """
+        return self._priority
+
+    @property
+    def service_time(self) -> float:
+        """Gets the consultation length of an arrival.
+
+        Returns:
+            float: The length in seconds, None for cancellations.
+        """
+        return self._service_time
+
+    def __str__(self) -> str:
+        """Returns the event in the ``Nome, Idade, Prioridade`` format, prefixed by "cancel " for cancellations.
+
+        Returns:
+            str: The input line of the event.
+        """
+        line = f"{self.name}, {self.age}, {self.priority}"
+        return line if self.kind == EVENT_ARRIVAL else f"cancel {line}"
+
+class WorkloadGenerator:
+    """Seeded generator of realistic arrival and cancellation streams.
+
+    Arrivals follow a Poisson process whose hourly rate varies along a daily
+    profile: the rate is constant inside each segment of the profile, so the
+    exponential gaps are drawn per segment and restarted at its end, which is
+    exact thanks to memorylessness. Each arrival draws its age band, priority
+    and exponential consultation length; some also schedule a cancellation
+    after an exponential delay. The same seed always yields the same stream.
+
+    Attributes:
+        _seed (int): The seed of the stream.
+        _rates (List[Tuple[float, float]]): The (hour of day, arrivals per hour) segments, sorted by hour.
+        _priority_mix (Dict[str, float]): The relative frequency of each priority name.
+        _age_mix (List[Tuple[int, int, float]]): The (youngest, oldest, relative frequency) age bands.
+        _cancel_probability (float): The probability of an arrival being cancelled later.
+        _mean_cancel_delay (float): The mean delay before a cancellation, in seconds.
+        _mean_service_time (float): The mean consultation length, in seconds.
+    """
+    def __init__(self, seed: int = DEFAULT_SEED, rates: List[Tuple[float, float]] = None, priority_mix: Dict[str, float] = None, age_mix: List[Tuple[int, int, float]] = None,
+                 cancel_probability: float = DEFAULT_CANCEL_PROBABILITY, mean_cancel_delay: float = DEFAULT_MEAN_CANCEL_DELAY, mean_service_time: float = DEFAULT_MEAN_SERVICE_TIME):
+        """Initializes a WorkloadGenerator instance.
+
+        Args:
+            seed (int): The seed of the stream.
+            rates (List[Tuple[float, float]]): The (hour of day, arrivals per hour) segments, DEFAULT_RATES by default.
+            priority_mix (Dict[str, float]): The relative frequency of each priority name, uniform over the installed priorities by default.
+            age_mix (List[Tuple[int, int, float]]): The (youngest, oldest, relative frequency) age bands, DEFAULT_AGE_MIX by default.
+            cancel_probability (float): The probability of an arrival being cancelled later.
+            mean_cancel_delay (float): The mean delay before a cancellation, in seconds.
+            mean_service_time (float): The mean consultation length, in seconds.
+
+        Raises:
+            ValueError: If the rate profile is empty or does not start at hour 0.
+        """
+        rates = sorted(DEFAULT_RATES if rates is None else rates)
+        if not rates or rates[0][0] != 0:
+            raise ValueError("O perfil de chegadas deve começar na hora 0")
+        self._seed: int = seed
+        self._rates: List[Tuple[float, float]] = rates
+        self._priority_mix: Dict[str, float] = priority_mix or {name: 1.0 for name in PRIORITIES_LIST}
+        self._age_mix: List[Tuple[int, int, float]] = age_mix or DEFAULT_AGE_MIX
+        self._cancel_probability: float = cancel_probability
+        self._mean_cancel_delay: float = mean_cancel_delay
+        self._mean_service_time: float = mean_service_time
+
+    def _segments(self, duration: float) -> Iterator[Tuple[float, float, float]]:
+        """Lays the daily rate profile over the simulated period.
+
+        Args:
+            duration (float): The length of the period, in seconds.
+
+        Returns:
+            Iterator[Tuple[float, float, float]]: The (start, end, arrivals per second) segments.
+        """
+        day = 0
+        while True:
+            for index, (hour, rate) in enumerate(self._rates):
+                next_hour = self._rates[index + 1][0] if index + 1 < len(self._rates) else HOURS_PER_DAY
+                start = (day * HOURS_PER_DAY + hour) * SECONDS_PER_HOUR
+                end = min((day * HOURS_PER_DAY + next_hour) * SECONDS_PER_HOUR, duration)
+                if start >= duration:
+                    return
+                yield start, end, rate / SECONDS_PER_HOUR
+            day += 1
+
+    def events(self, duration: float) -> Iterator[WorkloadEvent]:
+        """Generates the events of a simulated period in time order.
+
+        Args:
+            duration (float): The length of the period, in seconds.
+
+        Returns:
+            Iterator[WorkloadEvent]: The arrivals and cancellations.
+        """
+        generator = random.Random(self._seed)
+        priorities = list(self._priority_mix)
+        priority_weights = list(self._priority_mix.values())
+        age_weights = [weight for _, _, weight in self._age_mix]
+        cancellations = []
+        index = 0
+        for start, end, rate in self._segments(duration):
+            if rate <= 0:
+                continue
+            time = start + generator.expovariate(rate)
+            while time < end:
+                while cancellations and cancellations[0][0] <= time:
+                    yield heapq.heappop(cancellations)[-1]
+                youngest, oldest, _ = generator.choices(self._age_mix, age_weights)[0]
+                age = generator.randint(youngest, oldest)
+                priority = generator.choices(priorities, priority_weights)[0]
+                name = f"Paciente {index}"
+                index += 1
+                yield WorkloadEvent(time, EVENT_ARRIVAL, name, age, priority, generator.expovariate(1 / self._mean_service_time))
+                if generator.random() < self._cancel_probability:
+                    cancel_time = time + generator.expovariate(1 / self._mean_cancel_delay)
+                    if cancel_time < duration:
+                        heapq.heappush(cancellations, (cancel_time, index, WorkloadEvent(cancel_time, EVENT_CANCEL, name, age, priority)))
+                time += generator.expovariate(rate)
+        while cancellations:
+            yield heapq.heappop(cancellations)[-1]
+
+    def lines(self, duration: float) -> Iterator[str]:
+        """Generates the arrivals of a simulated period as ``Nome, Idade, Prioridade`` lines.
+
+        Args:
+            duration (float): The length of the period, in seconds.
+
+        Returns:
+            Iterator[str]: The arrival lines, as read by index.py.
+        """
+        for event in self.events(duration):
+            if event.kind == EVENT_ARRIVAL:
+                yield str(event)
+
+    def commands(self, duration: float) -> Iterator[str]:
+        """Generates the events of a simulated period as the commands of the streaming mode.
+
+        Args:
+            duration (float): The length of the period, in seconds.
+
+        Returns:
+            Iterator[str]: The arrival and "cancel" lines, as read by index.py --stream.
+        """
+        for event in self.events(duration):
+            yield str(event)
+
+    def feed(self, medical_management_system_service: MedicalManagementSystemService, duration: float) -> Dict[str, int]:
+        """Sends the events of a simulated period straight to a service, as fast as possible.
+
+        Args:
+            medical_management_system_service (MedicalManagementSystemService): The service to be fed.
+            duration (float): The length of the period, in seconds.
+
+        Returns:
+            Dict[str, int]: The number of arrivals and cancellations sent.
+        """
+        counts = {EVENT_ARRIVAL: 0, EVENT_CANCEL: 0}
+        for event in self.events(duration):
+            if event.kind == EVENT_ARRIVAL:
+                medical_management_system_service.make_an_appointment(event.name, event.age, event.priority)
+            else:
+                medical_management_system_service.cancel_an_appointment(event.name, event.age, event.priority)
+            counts[event.kind] += 1
+        return counts
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Gerador de carga sintética no formato do index.py")
+    parser.add_argument('--hours', type=float, default=HOURS_PER_DAY, help="duração simulada em horas")
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED)
+    parser.add_argument('--stream', action='store_true', help="gera os comandos do modo contínuo, com cancelamentos")
+    arguments = parser.parse_args()
+
+    workload_generator = WorkloadGenerator(arguments.seed)
+    duration = arguments.hours * SECONDS_PER_HOUR
+    if arguments.stream:
+        for line in workload_generator.commands(duration):
+            sys.stdout.write(line + '\n')
+    else:
+        lines = list(workload_generator.lines(duration))
+        sys.stdout.write(f"{len(lines)}\n")
+        for line in lines:
+            sys.stdout.write(line + '\n')
@@ -0,0 +1,211 @@
+import mmap
+import struct
+from typing import Iterable, Iterator, Tuple
+
+from entities.medical.MedicalAppointment import MedicalAppointment, pack_sort_key
+from entities.patients.Age import Age
+from entities.patients.Patient import Patient
+from entities.patients.Priority import Priority, WEIGHT_PRIORITIES_LIST
+
+SNAPSHOT_MAGIC = b'MMSB'
+SNAPSHOT_VERSION = 2
+# version 1 records left the sort key bytes as padding
+SNAPSHOT_VERSIONS = (1, SNAPSHOT_VERSION)
+# magic, version, record count, offset of the string heap
+HEADER = struct.Struct('<4sIQQ')
+# priority weight, age, effective sort key, name length, sequence, name offset
+RECORD = struct.Struct('<bBhIQQ')
+SORT_KEY = struct.Struct('<h')
+
+def write_binary_snapshot(path: str, medical_appointments: Iterable[MedicalAppointment], sort_keys: Iterable[int] = None) -> int:
+    """Writes medical appointments to a fixed-width binary snapshot.
+
+    The file holds a header, one fixed-width record per appointment in the
+    given order, then the UTF-8 string heap of the patient names. Records keep
+    the appointment's own weight and age next to its effective sort key,
+    which differs once aging promoted it. The sequence of each record is its
+    position, so records sort by (-sort key, sequence) when written in
+    attendance order.
+
+    Args:
+        path (str): The path of the snapshot file.
+        medical_appointments (Iterable[MedicalAppointment]): The appointments in attendance order.
+        sort_keys (Iterable[int]): The effective sort key of each appointment, None for their own keys.
+
+    Returns:
+        int: The number of records written.
+    """
+    records = bytearray()
+    names = bytearray()
+    count = 0
+    if sort_keys is None:
+        keyed = ((medical_appointment, medical_appointment.sort_key) for medical_appointment in medical_appointments)
+    else:
+        keyed = zip(medical_appointments, sort_keys)
+    for medical_appointment, sort_key in keyed:
+        name = medical_appointment.patient.name.encode('utf-8')
+        records += RECORD.pack(medical_appointment.priority.weight, medical_appointment.patient.age.age, sort_key, len(name), count, len(names))
+        names += name
+        count += 1
+    with open(path, 'wb') as file:
+        file.write(HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, count, HEADER.size + len(records)))
+        file.write(records)
+        file.write(names)
+    return count
+
+class MappedSnapshot:
+    """Read-only, memory-mapped view of a binary snapshot.
+
+    Opening only maps the file and reads its header; records are decoded on
+    access, so iterating or binary-searching the queue never deserializes
+    appointments that are not read.
+
+    Attributes:
+        _file (BinaryIO): The snapshot file.
+        _map (mmap.mmap): The read-only mapping of the file.
+        _count (int): The number of records.
+        _heap_offset (int): The offset of the string heap.
+        _version (int): The format version of the file.
+        _priority_names (dict): The priority name of each weight.
+    """
+    def __init__(self, path: str):
+        """Initializes a MappedSnapshot instance by mapping a snapshot file.
+
+        Args:
+            path (str): The path of the snapshot file.
+
+        Raises:
+            ValueError: If the file is not a binary snapshot.
+        """
+        self._file = open(path, 'rb')
+        self._map = None
+        self._count: int = 0
+        self._heap_offset: int = HEADER.size
+        self._priority_names = {weight: name for name, weight in WEIGHT_PRIORITIES_LIST.items()}
+
+        size = self._file.seek(0, 2)
+        if size < HEADER.size:
+            self._file.close()
+            raise ValueError("O arquivo não é um snapshot válido")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self._version, self._count, self._heap_offset = HEADER.unpack_from(self._map, 0)
+        if magic != SNAPSHOT_MAGIC or self._version not in SNAPSHOT_VERSIONS:
+            self.close()
+            raise ValueError("O arquivo não é um snapshot válido")
+
+    def __len__(self) -> int:
+        """Returns the number of records.
+
+        Returns:
+            int: The number of appointments in the snapshot.
+        """
+        return self._count
+
+    def record(self, position: int) -> Tuple[int, int, int, str]:
+        """Decodes one record.
+
+        Args:
+            position (int): The position of the record in attendance order.
+
+        Returns:
+            Tuple[int, int, int, str]: The priority weight, age, sequence and patient name.
+
+        Raises:
+            IndexError: If the position is out of range.
+        """
+        if not 0 <= position < self._count:
+            raise IndexError("A posição está fora do snapshot")
+        weight, age, _, name_length, sequence, name_offset = RECORD.unpack_from(self._map, HEADER.size + position * RECORD.size)
+        start = self._heap_offset + name_offset
+        return weight, age, sequence, self._map[start:start + name_length].decode('utf-8')
+
+    def __getitem__(self, position: int) -> MedicalAppointment:
+        """Rebuilds the medical appointment of one record.
+
+        Args:
+            position (int): The position of the record in attendance order.
+
+        Returns:
+            MedicalAppointment: The medical appointment.
+        """
+        weight, age, _, name = self.record(position)
+        return MedicalAppointment(Patient(name, Age.of(age)), Priority.of(self._priority_names[weight]))
+
+    def __iter__(self) -> Iterator[MedicalAppointment]:
+        """Iterates the medical appointments in attendance order.
+
+        Returns:
+            Iterator[MedicalAppointment]: The medical appointments.
+        """
+        for position in range(self._count):
+            yield self[position]
+
+    def iter_names(self, offset: int = 0, limit: int = None) -> Iterator[str]:
+        """Streams the patient names in attendance order.
+
+        Args:
+            offset (int): The number of records to skip.
+            limit (int): The maximum number of names to yield, or None for all of them.
+
+        Returns:
+            Iterator[str]: The patient names.
+        """
+        stop = self._count if limit is None else min(self._count, offset + limit)
+        for position in range(offset, stop):
+            yield self.record(position)[3]
+
+    def _sort_key(self, position: int) -> int:
+        """Reads the effective sort key of one record.
+
+        Args:
+            position (int): The position of the record in attendance order.
+
+        Returns:
+            int: The sort key, packed from the weight and age in version 1 files.
+        """
+        offset = HEADER.size + position * RECORD.size
+        if self._version == 1:
+            return pack_sort_key(*struct.unpack_from('<bB', self._map, offset))
+        return SORT_KEY.unpack_from(self._map, offset + 2)[0]
+
+    def count_ahead(self, weight: int, age: int) -> int:
+        """Binary-searches how many records are served before a new (weight, age) arrival.
+
+        The search runs on the effective sort keys, which are in attendance
+        order even when aging promoted some appointments.
+
+        Args:
+            weight (int): The priority weight of the arrival.
+            age (int): The age of the arrival.
+
+        Returns:
+            int: The number of records whose effective key is greater than or equal to the key of (weight, age).
+        """
+        sort_key = pack_sort_key(weight, age)
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            if self._sort_key(middle) >= sort_key:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def close(self):
+        """Unmaps and closes the snapshot file."""
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+    def __enter__(self) -> 'MappedSnapshot':
+        """Enters a context that closes the snapshot on exit.
+
+        Returns:
+            MappedSnapshot: The snapshot itself.
+        """
+        return self
+
+    def __exit__(self, *exc_info):
+        """Closes the snapshot when the context exits."""
+        self.close()
@@ -0,0 +1,241 @@
+import json
+import os
+import threading
+import time
+from typing import Iterable, Iterator, List, TextIO
+
+from entities.medical.MedicalAppointment import MedicalAppointment
+
+OPERATION_ADD = 'A'
+OPERATION_DISPATCH = 'D'
+OPERATION_CANCEL = 'C'
+LOG_FILE_NAME = 'appointments.wal'
+SNAPSHOT_FILE_NAME = 'appointments.snapshot'
+DEFAULT_GROUP_SIZE = 256
+DEFAULT_GROUP_INTERVAL = 0.05
+
+class WriteAheadLog:
+    """Append-only log of queue operations with group-committed fsync calls.
+
+    Every record is one JSON line ``[operation, name, age, priority]``, flushed
+    to the operating system as soon as it is appended, so it survives the death
+    of the process. Only the fsync, which protects against a machine crash, is
+    grouped: it runs once group_size records are pending, and a background
+    thread runs it for the records still pending group_interval seconds after
+    the last sync. A checkpoint writes the whole queue to a snapshot and starts
+    a new log generation, so recovery reads the snapshot plus the log tail
+    written after it.
+
+    Attributes:
+        _directory (str): The directory holding the log and the snapshot.
+        _group_size (int): The number of pending records that forces a sync.
+        _group_interval (float): The seconds after which pending records are synced.
+        _generation (int): The generation of the current log.
+        _file (TextIO): The log file opened for appending.
+        _pending (int): The number of records written since the last sync.
+        _last_sync (float): The monotonic time of the last sync.
+        _lock (threading.Lock): The lock guarding the file against the background sync.
+        _closed (threading.Event): Set when the log is closed, stopping the background sync.
+        _syncer (threading.Thread): The background thread syncing pending records.
+    """
+    def __init__(self, directory: str, group_size: int = DEFAULT_GROUP_SIZE, group_interval: float = DEFAULT_GROUP_INTERVAL):
+        """Initializes a WriteAheadLog instance, creating its directory if needed.
+
+        Args:
+            directory (str): The directory holding the log and the snapshot.
+            group_size (int): The number of pending records that forces a sync.
+            group_interval (float): The seconds after which pending records are synced.
+        """
+        self._directory: str = directory
+        self._group_size: int = group_size
+        self._group_interval: float = group_interval
+        self._generation: int = 0
+        self._file: TextIO = None
+        self._pending: int = 0
+        self._last_sync: float = time.monotonic()
+        self._lock: threading.Lock = threading.Lock()
+        self._closed: threading.Event = threading.Event()
+        self._syncer: threading.Thread = None
+
+        os.makedirs(directory, exist_ok=True)
+
+    @property
+    def log_path(self) -> str:
+        """Gets the path of the log file.
+
+        Returns:
+            str: The path of the log file.
+        """
+        return os.path.join(self._directory, LOG_FILE_NAME)
+
+    @property
+    def snapshot_path(self) -> str:
+        """Gets the path of the snapshot file.
+
+        Returns:
+            str: The path of the snapshot file.
+        """
+        return os.path.join(self._directory, SNAPSHOT_FILE_NAME)
+
+    def _read_generation(self, path: str) -> int:
+        """Reads the generation header of the log or of the snapshot.
+
+        Args:
+            path (str): The path of the file.
+
+        Returns:
+            int: The generation, or -1 if the file does not exist or has no header.
+        """
+        if not os.path.exists(path):
+            return -1
+        with open(path, encoding='utf-8') as file:
+            header = file.readline()
+        try:
+            return json.loads(header)['generation']
+        except (ValueError, KeyError, TypeError):
+            return -1
+
+    def _write_atomically(self, path: str, lines: Iterable[str]):
+        """Writes a file through a temporary file, fsync and rename.
+
+        Args:
+            path (str): The path of the file.
+            lines (Iterable[str]): The lines to be written, with their line breaks.
+        """
+        temporary_path = path + '.tmp'
+        with open(temporary_path, 'w', encoding='utf-8') as file:
+            file.writelines(lines)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary_path, path)
+
+    def records(self) -> Iterator[list]:
+        """Reads the operations to be replayed: the snapshot, then the log written after it.
+
+        A log from an older generation was already folded into the snapshot by an
+        interrupted checkpoint, so it is skipped. A torn last line is ignored.
+
+        Returns:
+            Iterator[list]: The [operation, name, age, priority] records in order.
+        """
+        snapshot_generation = self._read_generation(self.snapshot_path)
+        paths = [self.snapshot_path] if snapshot_generation >= 0 else []
+        log_generation = self._read_generation(self.log_path)
+        if log_generation >= 0 and log_generation >= snapshot_generation:
+            paths.append(self.log_path)
+        for path in paths:
+            for record, _ in self._valid_records(path):
+                yield record
+
+    def _valid_records(self, path: str) -> Iterator[tuple]:
+        """Reads the complete records of a file, stopping at the first torn or invalid line.
+
+        Args:
+            path (str): The path of the log or of the snapshot.
+
+        Returns:
+            Iterator[tuple]: Each record with the byte offset right after its line.
+        """
+        with open(path, 'rb') as file:
+            offset = len(file.readline())
+            for line in file:
+                if not line.endswith(b'\n'):
+                    return
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    return
+                offset += len(line)
+                yield record, offset
+
+    def _truncate_torn_tail(self):
+        """Cuts the log after its last complete record, so new records are not appended behind a torn one."""
+        with open(self.log_path, 'rb') as file:
+            valid_length = len(file.readline())
+        for _, valid_length in self._valid_records(self.log_path):
+            pass
+        if os.path.getsize(self.log_path) > valid_length:
+            with open(self.log_path, 'r+b') as file:
+                file.truncate(valid_length)
+                file.flush()
+                os.fsync(file.fileno())
+
+    def open(self):
+        """Opens the log for appending, creating it if needed, and starts the background sync."""
+        self._generation = max(self._read_generation(self.log_path), self._read_generation(self.snapshot_path), 0)
+        if self._read_generation(self.log_path) != self._generation:
+            self._write_atomically(self.log_path, [json.dumps({'generation': self._generation}) + '\n'])
+        else:
+            self._truncate_torn_tail()
+        self._file = open(self.log_path, 'a', encoding='utf-8')
+        self._last_sync = time.monotonic()
+        self._closed.clear()
+        self._syncer = threading.Thread(target=self._sync_periodically, name='WriteAheadLogSync', daemon=True)
+        self._syncer.start()
+
+    def _sync_periodically(self):
+        """Syncs the records left pending for group_interval seconds, until the log is closed."""
+        while not self._closed.wait(self._group_interval):
+            with self._lock:
+                if self._pending and time.monotonic() - self._last_sync >= self._group_interval:
+                    self._sync()
+
+    def append(self, operation: str, medical_appointment: MedicalAppointment):
+        """Appends an operation, syncing the pending group when it is due.
+
+        Args:
+            operation (str): OPERATION_ADD, OPERATION_DISPATCH or OPERATION_CANCEL.
+            medical_appointment (MedicalAppointment): The medical appointment of the operation.
+        """
+        patient = medical_appointment.patient
+        line = json.dumps([operation, patient.name, patient.age.age, medical_appointment.priority.name]) + '\n'
+        with self._lock:
+            self._file.write(line)
+            self._file.flush()
+            self._pending += 1
+            if self._pending >= self._group_size:
+                self._sync()
+
+    def _sync(self):
+        """Flushes and fsyncs every pending record, with the lock held."""
+        if self._file is None:
+            return
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._pending = 0
+        self._last_sync = time.monotonic()
+
+    def sync(self):
+        """Flushes and fsyncs every pending record."""
+        with self._lock:
+            self._sync()
+
+    def checkpoint(self, medical_appointments: Iterable[MedicalAppointment]):
+        """Writes a snapshot of the queue and starts a new, empty log generation.
+
+        Args:
+            medical_appointments (Iterable[MedicalAppointment]): The queued appointments, in attendance order.
+        """
+        generation = self._generation + 1
+        lines: List[str] = [json.dumps({'generation': generation}) + '\n']
+        for medical_appointment in medical_appointments:
+            patient = medical_appointment.patient
+            lines.append(json.dumps([OPERATION_ADD, patient.name, patient.age.age, medical_appointment.priority.name]) + '\n')
+        with self._lock:
+            self._sync()
+            self._write_atomically(self.snapshot_path, lines)
+            self._file.close()
+            self._write_atomically(self.log_path, [json.dumps({'generation': generation}) + '\n'])
+            self._generation = generation
+            self._file = open(self.log_path, 'a', encoding='utf-8')
+
+    def close(self):
+        """Stops the background sync, then syncs and closes the log."""
+        if self._file is None:
+            return
+        self._closed.set()
+        self._syncer.join()
+        with self._lock:
+            self._sync()
+            self._file.close()
+            self._file = None
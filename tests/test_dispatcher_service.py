@@ -0,0 +1,60 @@
+import random
+import unittest
+
+from entities.medical.AgingPolicy import AgingPolicy
+from entities.medical.ConsultationRoom import ConsultationRoom
+from entities.medical.MedicalAppointment import MedicalAppointment
+from entities.medical.MedicalManagementSystem import QUEUE_ENGINES, MedicalManagementSystem
+from entities.patients.Age import Age
+from entities.patients.Patient import Patient
+from entities.patients.Priority import PRIORITIES_LIST, Priority
+from services.DispatcherService import DispatcherService
+
+
+class DispatcherAgingTest(unittest.TestCase):
+    def setUp(self):
+        self.now = 0.0
+
+    def clock(self) -> float:
+        return self.now
+
+    def make_system(self, engine: str) -> MedicalManagementSystem:
+        system = MedicalManagementSystem('Teste', engine)
+        system.enable_aging(AgingPolicy(10, clock=self.clock))
+        return system
+
+    def test_restricted_rooms_serve_promoted_patients(self):
+        for engine in QUEUE_ENGINES:
+            with self.subTest(engine=engine):
+                system = self.make_system(engine)
+                dispatcher = DispatcherService(system, clock=self.clock)
+                dispatcher.add_room(ConsultationRoom('Pediatria', max_age=17))
+                dispatcher.add_room(ConsultationRoom('Normal', priorities=['normal']))
+                child = MedicalAppointment(Patient('Criança', Age.of(5)), Priority.of('normal'))
+                adult = MedicalAppointment(Patient('Adulto', Age.of(30)), Priority.of('normal'))
+                system.add_appointments([child, adult])
+                # the child reaches the top key and the adult the urgente tier
+                self.now = 25.0
+                system.peek_next()
+                assignments = {room.name: appointment for room, appointment in dispatcher.assign()}
+                self.assertEqual(assignments, {'Pediatria': child, 'Normal': adult})
+                self.assertEqual(len(system), 0)
+
+    def test_filtered_pops_follow_the_aged_order(self):
+        sort_keys = frozenset(ConsultationRoom('Pediatria', max_age=17).sort_keys())
+        for engine in QUEUE_ENGINES:
+            with self.subTest(engine=engine):
+                generator = random.Random(7)
+                system = self.make_system(engine)
+                key_filter = system.compile_filter(sort_keys)
+                for index in range(2000):
+                    self.now += 1.0
+                    appointment = MedicalAppointment(Patient(f'p{index}', Age.of(generator.randint(0, 40))), Priority.of(generator.choice(PRIORITIES_LIST)))
+                    system.add_appointment(appointment)
+                    if index % 3 == 0:
+                        expected = next((queued for queued in system.appointments if queued.sort_key in sort_keys), None)
+                        self.assertIs(system.pop_next_matching(key_filter), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+import os
+import subprocess
+import sys
+import tempfile
+import textwrap
+import unittest
+
+from entities.medical.DurableMedicalManagementSystem import DurableMedicalManagementSystem
+from entities.medical.MedicalAppointment import MedicalAppointment
+from entities.patients.Age import Age
+from entities.patients.Patient import Patient
+from entities.patients.Priority import Priority
+from storage.WriteAheadLog import WriteAheadLog
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CRASHING_SCRIPT = textwrap.dedent("""
+    import os
+    import sys
+
+    from entities.medical.DurableMedicalManagementSystem import DurableMedicalManagementSystem
+    from entities.medical.MedicalAppointment import MedicalAppointment
+    from entities.patients.Age import Age
+    from entities.patients.Patient import Patient
+    from entities.patients.Priority import Priority
+    from storage.WriteAheadLog import WriteAheadLog
+
+    system = DurableMedicalManagementSystem('Teste', WriteAheadLog(sys.argv[1]), checkpoint_every=int(sys.argv[2]))
+    for index in range(20):
+        system.add_appointment(MedicalAppointment(Patient(f'p{index}', Age.of(index)), Priority.of('normal')))
+    system.pop_next()
+    system.cancel_appointment(MedicalAppointment(Patient('p4', Age.of(4)), Priority.of('normal')))
+    os._exit(0)
+""")
+
+def appointment(index: int) -> MedicalAppointment:
+    """Builds the normal-priority appointment of patient p<index>, aged index."""
+    return MedicalAppointment(Patient(f'p{index}', Age.of(index)), Priority.of('normal'))
+
+class WriteAheadLogRecoveryTest(unittest.TestCase):
+    """Crash recovery of the DurableMedicalManagementSystem."""
+
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self._directory.cleanup)
+
+    def _recover(self) -> DurableMedicalManagementSystem:
+        system = DurableMedicalManagementSystem('Teste', WriteAheadLog(self._directory.name))
+        self.addCleanup(system.close)
+        return system
+
+    def _crash(self, checkpoint_every: int):
+        environment = dict(os.environ, PYTHONPATH=ROOT)
+        subprocess.run([sys.executable, '-c', CRASHING_SCRIPT, self._directory.name, str(checkpoint_every)], cwd=ROOT, env=environment, check=True)
+
+    def test_process_death_keeps_every_appended_record(self):
+        for checkpoint_every in (0, 7):
+            with self.subTest(checkpoint_every=checkpoint_every):
+                self._directory.cleanup()
+                self._directory = tempfile.TemporaryDirectory()
+                self._crash(checkpoint_every)
+                system = self._recover()
+                expected = [f'p{index}' for index in range(18, -1, -1) if index != 4]
+                self.assertEqual(list(system.iter_order()), expected)
+
+    def test_appends_after_a_torn_tail_are_recovered(self):
+        system = self._recover()
+        for index in range(3):
+            system.add_appointment(appointment(index))
+        system.close()
+        with open(system.write_ahead_log.log_path, 'a', encoding='utf-8') as file:
+            file.write('["A", "torn", 4')
+
+        system = self._recover()
+        self.assertEqual(list(system.iter_order()), ['p2', 'p1', 'p0'])
+        for index in range(3, 6):
+            system.add_appointment(appointment(index))
+        system.close()
+
+        system = self._recover()
+        self.assertEqual(list(system.iter_order()), ['p5', 'p4', 'p3', 'p2', 'p1', 'p0'])
+
+if __name__ == '__main__':
+    unittest.main()